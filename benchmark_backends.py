@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+렌더링 백엔드 비교 (matplotlib vs QGraphicsScene)
+
+작업 수별로 전체 갱신, 드래그 한 프레임, 점 적중 판정에 걸리는 시간을 잰다.
+화면 없이도 돌도록 Qt는 offscreen 플랫폼을 쓴다.
+
+    python benchmark_backends.py --sizes 100 1000 10000
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QGraphicsView
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from eisenhower import font_cache
+from eisenhower.task_manager import TaskManager
+from eisenhower.components.backend import MatplotlibBackend
+from eisenhower.components.scene import SceneBackend, create_scene
+
+
+def make_task_manager(directory, count, seed=0):
+    """작업 count개짜리 작업 파일을 만들어 불러오기"""
+    rng = random.Random(seed)
+    path = os.path.join(directory, f'tasks_{count}.json')
+    tasks = [{"할 일": f"작업 {i}", "긴급도": rng.randint(1, 5), "중요도": rng.randint(1, 5)}
+             for i in range(count)]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"total_minutes": 480, "tasks": tasks}, f, ensure_ascii=False)
+    return TaskManager(path, use_journal=False)
+
+
+def create_matplotlib(app):
+    """Agg 캔버스의 matplotlib 백엔드 (화면에 그린 것과 같은 그림)"""
+    fig = Figure(figsize=(17, 10))
+    FigureCanvasAgg(fig)
+    backend = MatplotlibBackend(fig, 12)
+    return backend, lambda: None
+
+
+def create_scene_backend(app):
+    """offscreen 창에 띄운 QGraphicsScene 백엔드 (그리기는 이벤트 처리 때)"""
+    scene = create_scene()
+    backend = SceneBackend(scene, 12)
+    view = QGraphicsView(scene)
+    view.resize(1300, 700)
+    view.show()
+    backend.view = view  # 벤치마크 동안 창 유지
+    return backend, app.processEvents
+
+
+def measure(function, repeat):
+    """function을 repeat번 실행한 평균 시간 (밀리초)"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        function(i)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run(app, create, task_manager, repeat):
+    """백엔드 하나의 갱신, 드래그 프레임, 적중 판정 시간"""
+    backend, flush = create(app)
+    tasks = task_manager.tasks
+
+    def update(i):
+        minutes = 120 + (i % 80) * 5
+        allocation = task_manager.recalculate_time(minutes)
+        backend.update(tasks, allocation, task_manager.available_hours,
+                       task_manager.available_minutes_part)
+        flush()
+
+    # 첫 갱신은 정적 배경까지 그리므로 측정에서 뺌
+    update(0)
+    flush()
+    update_ms = measure(update, repeat)
+
+    point = backend.matrix.points[0]
+    backend.matrix.begin_drag(point)
+    backend.matrix.set_low_fidelity(True)
+    flush()
+
+    def drag(i):
+        point.update_position(1 + (i % 40) * 0.1, 1 + (i % 30) * 0.13)
+        backend.render_drag()
+        flush()
+
+    drag_ms = measure(drag, repeat * 4)
+    backend.matrix.end_drag()
+    backend.matrix.set_low_fidelity(False)
+
+    positions = np.random.default_rng(0).uniform(0.5, 5.5, (repeat * 20, 2))
+    hit_ms = measure(lambda i: backend.matrix.get_point_at_position(*positions[i]),
+                     len(positions))
+    return update_ms, drag_ms, hit_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="렌더링 백엔드 비교")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help="작업 수 (여러 개)")
+    parser.add_argument('--repeat', type=int, default=10, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    font_cache.setup_matplotlib(12)  # 앱과 같은 글꼴 (한글 글리프)
+    backends = [('matplotlib', create_matplotlib), ('scene', create_scene_backend)]
+    print(f"{'백엔드':<12}{'작업 수':>8}{'갱신(ms)':>12}{'드래그(ms)':>12}{'적중(ms)':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for count in args.sizes:
+            task_manager = make_task_manager(directory, count)
+            for name, create in backends:
+                update_ms, drag_ms, hit_ms = run(app, create, task_manager, args.repeat)
+                print(f"{name:<12}{count:>8}{update_ms:>12.2f}{drag_ms:>12.2f}{hit_ms:>12.3f}")
+            task_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,16 @@
-from .visualizer import EisenhowerVisualizer
-from .task_manager import TaskManager
+# 무거운 모듈(matplotlib, PyQt5)은 처음 쓸 때 불러옴
+_EXPORTS = {
+    'TaskManager': '.task_manager',
+    'EisenhowerVisualizer': '.visualizer',
+}
 
 __all__ = ['TaskManager', 'EisenhowerVisualizer']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value  # 다음부터는 모듈 속성으로 바로 찾음
+    return value
@@ -0,0 +1,115 @@
+import os
+
+import numpy as np
+
+from .matrix import Matrix
+from .pie_chart import PieChart
+from .render_backend import RenderBackend
+from .renderer import BlitRenderer
+from .scheduler import FrameScheduler
+from .stats import FRAME_BUDGET
+
+
+class MatplotlibBackend(RenderBackend):
+    """matplotlib 렌더링 백엔드 (화면 표시와 파일 내보내기에 사용)
+
+    그림 하나에 두 축을 만들고 BlitRenderer로 바뀐 영역만 다시 그린다. 갱신 요청은
+    FrameScheduler로 한 프레임에 한 번만 처리하고, save()로 파일 저장도 한다.
+    """
+
+    name = 'matplotlib'
+
+    def __init__(self, fig, base_font_size):
+        self.fig = fig
+        pie_ax, matrix_ax = fig.subplots(1, 2)
+        self.pie_chart = PieChart(pie_ax, base_font_size)
+        self.matrix = Matrix(matrix_ax, base_font_size)
+
+        # 렌더링 파이프라인: 영역별로 매번 다시 그리는 아티스트 등록
+        self.renderer = BlitRenderer(fig.canvas)
+        self.renderer.add_layer(
+            'pie', pie_ax, self.pie_chart.dynamic_artists,
+            extent_artists=lambda: [pie_ax.title],
+            overlay=self.pie_chart.timer_artists)
+        # 타이머는 1초마다 타이머 점과 텍스트 범위만 다시 그림
+        self.pie_chart.redraw_timer = lambda: self.renderer.render_overlay('pie')
+        self.renderer.add_layer(
+            'matrix', matrix_ax, self.matrix.dynamic_artists,
+            overlay=self.matrix.drag_artists)
+
+        # 슬라이더, 입력 필드, 드래그 갱신은 한 프레임에 한 번만 (마지막 값으로)
+        self.scheduler = FrameScheduler(fig.canvas, FRAME_BUDGET)
+
+    def update(self, tasks, allocation, available_hours, available_minutes_part):
+        """파이 차트와 매트릭스 갱신 후 바뀐 아티스트만 다시 그림"""
+        self.pie_chart.draw(allocation, available_hours, available_minutes_part)
+        self.matrix.draw(tasks, allocation)
+        self.renderer.render()
+
+    def preview(self, allocation, available_hours, available_minutes_part):
+        """파이 차트만 갱신해 파이 영역만 blit"""
+        self.pie_chart.draw(allocation, available_hours, available_minutes_part)
+        self.renderer.render('pie')
+
+    def begin_drag(self, point):
+        """선택된 점을 뺀 매트릭스 영역만 한 번 그려 둠 (전체 그리기 없음)
+
+        드래그 중에는 그 위에 드래그용 점과 라벨만 덧그리고, 파이 차트 미리보기도
+        부채꼴 라벨 없이 그린다.
+        """
+        super().begin_drag(point)
+        self.pie_chart.set_low_fidelity(True)
+        self.renderer.render('matrix')
+
+    def end_drag(self):
+        """점 끌기 끝 (파이 차트 라벨은 다음 update()에서 다시 표시)"""
+        super().end_drag()
+        self.pie_chart.set_low_fidelity(False)
+
+    def render_drag(self):
+        """드래그용 점과 라벨만 다시 그리고 바뀐 범위만 blit"""
+        self.renderer.render_overlay('matrix')
+
+    def schedule(self, name, callback, *args):
+        """프레임마다 이름별 마지막 요청만 처리"""
+        self.scheduler.request(name, callback, *args)
+
+    def cancel(self, name):
+        self.scheduler.cancel(name)
+
+    def stop(self):
+        """남은 프레임과 파이 차트 타이머 정리"""
+        self.scheduler.stop()
+        self.pie_chart.stop_timer()
+
+    def save(self, path, format=None):
+        """현재 그림을 파일로 저장 (형식은 path의 확장자)
+
+        Agg 캔버스의 PNG는 update()가 그려 둔 버퍼를 그대로 쓰므로 정적인 배경을
+        다시 그리지 않는다. 벡터 형식(SVG, PDF)은 동적 아티스트를 잠시 전체
+        그리기에 포함시키고, 사분면 배경도 이미지 대신 벡터로 그려 저장한다.
+        """
+        format = (format or os.path.splitext(path)[1][1:]).lower()
+        canvas = self.fig.canvas
+        if format == 'png' and hasattr(canvas, 'buffer_rgba'):
+            from matplotlib.image import imsave
+            if not self.renderer.valid:
+                self.renderer.render()
+            imsave(path, np.asarray(canvas.buffer_rgba()), format='png', dpi=self.fig.dpi)
+            return
+
+        artists = [artist for layer in self.renderer.layers.values()
+                   for artist in layer.all_artists()]
+        for artist in artists:
+            artist.set_animated(False)
+        background = self.matrix.background
+        vector_artists = background.add_vector_artists()
+        background.set_visible(False)
+        try:
+            self.fig.savefig(path, format=format)
+        finally:
+            for artist in vector_artists:
+                artist.remove()
+            background.set_visible(True)
+            for artist in artists:
+                artist.set_animated(True)
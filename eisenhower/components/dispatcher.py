@@ -0,0 +1,80 @@
+from collections import Counter
+
+
+class EventDispatcher:
+    """캔버스 마우스 이벤트를 한 번만 연결하고, 이벤트가 일어난 축을 가진
+    구성 요소에만 전달
+
+    버튼을 누른 구성 요소는 버튼을 놓을 때까지 움직임/놓기 이벤트를 계속
+    받는다 (드래그 중 포인터가 축 밖으로 나가는 경우). 구성 요소별 전달 횟수와
+    캔버스에 연결된 핸들러 수를 세어 두어 긴 세션에서도 핸들러가 늘지 않는지
+    확인할 수 있다.
+    """
+
+    EVENTS = ('button_press_event', 'motion_notify_event', 'button_release_event')
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.components = []  # (이름, 축 목록, 이벤트별 핸들러)
+        self.counts = Counter()  # (이벤트, 구성 요소) -> 전달 횟수
+        self.unrouted = Counter()  # 이벤트 -> 해당 구성 요소가 없던 횟수
+        self._grab = None  # 버튼을 누른 구성 요소
+        self._cids = [canvas.mpl_connect(name, self._dispatch) for name in self.EVENTS]
+
+    def register(self, name, axes, on_press=None, on_motion=None, on_release=None):
+        """구성 요소 등록 (axes는 축 하나 또는 축 목록)"""
+        if not isinstance(axes, (list, tuple)):
+            axes = [axes]
+        handlers = {
+            'button_press_event': on_press,
+            'motion_notify_event': on_motion,
+            'button_release_event': on_release,
+        }
+        self.components.append((name, list(axes), handlers))
+
+    def _hit(self, event):
+        """이벤트가 일어난 축을 가진 구성 요소"""
+        if event.inaxes is None:
+            return None
+        for component in self.components:
+            if event.inaxes in component[1]:
+                return component
+        return None
+
+    def _dispatch(self, event):
+        """이벤트를 구성 요소 하나에만 전달"""
+        if event.name == 'button_press_event':
+            component = self._grab = self._hit(event)
+        else:
+            component = self._grab or self._hit(event)
+            if event.name == 'button_release_event':
+                self._grab = None
+
+        if component is None:
+            self.unrouted[event.name] += 1
+            return
+        name, _, handlers = component
+        self.counts[(event.name, name)] += 1
+        handler = handlers[event.name]
+        if handler is not None:
+            handler(event)
+
+    def handler_count(self):
+        """캔버스에 연결된 이벤트별 핸들러 수 (위젯이 직접 연결한 것 포함)"""
+        return {name: len(callbacks)
+                for name, callbacks in self.canvas.callbacks.callbacks.items()}
+
+    def stats(self):
+        """전달 횟수와 핸들러 수 요약"""
+        return {
+            'dispatched': {f'{event}:{name}': count
+                           for (event, name), count in self.counts.items()},
+            'unrouted': dict(self.unrouted),
+            'handlers': self.handler_count(),
+        }
+
+    def disconnect(self):
+        """캔버스 연결 해제"""
+        for cid in self._cids:
+            self.canvas.mpl_disconnect(cid)
+        self._cids = []
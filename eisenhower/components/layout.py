@@ -0,0 +1,115 @@
+# 매트릭스/파이 차트의 배치 계산 (matplotlib과 Qt 렌더링 백엔드가 함께 씀)
+
+import numpy as np
+
+
+class MatrixPoint:
+    """매트릭스의 점 하나 (점 모음에서 index 번째 점을 가리킴)"""
+
+    def __init__(self, matrix, index, task, color):
+        self.matrix = matrix
+        self.index = index
+        self.task = task
+        self.task_id = task.id
+        self.color = color
+        self.text = None
+        self.is_selected = False
+        self.dragged_pos = [task.urgency, task.importance]
+
+    @property
+    def scatter(self):
+        """모든 점이 함께 쓰는 점 모음"""
+        return self.matrix.collection
+
+    def update_position(self, urgency, importance):
+        """위치 업데이트 (작업 값은 놓을 때 TaskManager를 통해 반영)"""
+        self.dragged_pos = [urgency, importance]
+        self.matrix.move_point(self.index, urgency, importance)
+
+    def set_text(self, text):
+        """텍스트 설정 (라벨이 생략된 점은 None)"""
+        self.text = text
+
+    def highlight(self, highlight=True):
+        """점 강조/해제"""
+        if highlight != self.is_selected:
+            self.matrix.scale_point(self.index, 1.2 if highlight else 1 / 1.2)
+        self.is_selected = highlight
+
+
+# 라벨 하나가 차지하는 화면 크기 (폰트 크기 배수): 이 크기의 격자 칸마다 라벨 하나
+LABEL_CELL_WIDTH = 6.0
+LABEL_CELL_HEIGHT = 2.6
+
+
+def label_cells(screen, assigned, cell_width, cell_height):
+    """화면 좌표를 cell_width x cell_height 격자로 나눠 칸마다 라벨을 붙일 점 고르기
+
+    같은 칸의 점들 중 할당 시간이 가장 큰 점(같으면 번호가 작은 점)을 고른다.
+    (고른 점 번호 배열, 각 칸의 점 수 배열)을 반환한다.
+    """
+    count = len(screen)
+    columns = np.floor(screen[:, 0] / cell_width).astype(np.int64)
+    rows = np.floor(screen[:, 1] / cell_height).astype(np.int64)
+    cells = columns * (1 << 20) + rows
+
+    # 칸 순서, 칸 안에서는 할당 시간이 큰 순서로 정렬해 칸마다 첫 점을 고름
+    order = np.lexsort((np.arange(count), -assigned, cells))
+    sorted_cells = cells[order]
+    first = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    return order[first], np.diff(np.r_[first, count])
+
+
+# 이보다 좁은 부채꼴에는 라벨을 표시하지 않음 (도)
+MIN_LABEL_ANGLE = 12
+
+# "기타" 부채꼴 색상
+OTHER_COLOR = '#DDDDDD'
+
+
+def pie_slices(allocation, max_wedges):
+    """파이 차트에 그릴 조각 계산
+
+    할당 시간이 0보다 큰 작업을 긴급하고 중요한 순서로 정렬하고, 작업이 max_wedges개를
+    넘으면 할당 시간이 큰 (max_wedges - 1)개만 따로 그리고 나머지는 "기타" 조각 하나로
+    묶는다. (작업 번호 배열, 조각별 시간, 묶인 작업 수, 총 시간)을
+    반환하며, "기타"가 있으면 조각별 시간 배열의 끝에 붙는다.
+    """
+    # 할당 시간이 0보다 큰 작업만 선택
+    visible = np.flatnonzero(allocation.assigned > 0)
+
+    # 긴급도와 중요도에 따라 정렬 (긴급하고 중요한 순서대로, 같으면 원래 순서)
+    visible = visible[np.lexsort((
+        -allocation.importance[visible].astype(int),
+        -allocation.urgency[visible].astype(int)))]
+    times = allocation.assigned[visible]
+    total_minutes = int(times.sum())
+
+    # 할당 시간이 작은 작업은 "기타" 조각 하나로 묶음 (조각 수는 상한 이하)
+    kept = _kept_positions(times, max_wedges)
+    other_minutes = total_minutes - int(times[kept].sum())
+    other_count = len(times) - len(kept)
+    visible, times = visible[kept], times[kept]
+    if other_count:
+        times = np.append(times, other_minutes)
+    return visible, times, other_count, total_minutes
+
+
+def _kept_positions(times, max_wedges):
+    """따로 조각을 그릴 작업의 위치 (나머지는 "기타"로 묶음)
+
+    작업이 아무리 많아도 할당 시간이 큰 작업은 항상 따로 그려지므로, 작업이 모두
+    작을 때 파이 전체가 "기타" 하나가 되는 일이 없다.
+    """
+    count = len(times)
+    if count <= max_wedges:
+        return np.arange(count)
+    # 할당 시간이 큰 작업부터 (max_wedges - 1)개, 원래 순서는 유지
+    largest = np.argsort(-times, kind='stable')[:max_wedges - 1]
+    return np.sort(largest)
+
+
+def wedge_angles(times, total_minutes):
+    """조각 경계 각도 (12시 방향에서 시계 방향으로, ax.pie(startangle=90,
+    counterclock=False)와 같은 각도)"""
+    return 90 - 360 * np.concatenate(([0], np.cumsum(times))) / total_minutes
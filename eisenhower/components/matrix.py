@@ -1,39 +1,9 @@
 import numpy as np
+from matplotlib.colors import to_rgba_array
 
-
-class MatrixPoint:
-    def __init__(self, task, color):
-        self.task = task
-        self.color = color
-        self.text = None
-        self.scatter = None
-        self.is_selected = False
-        self.dragged_pos = [task.urgency, task.importance]
-
-    def update_position(self, urgency, importance):
-        """위치 업데이트"""
-        self.task.urgency = urgency
-        self.task.importance = importance
-        self.dragged_pos = [urgency, importance]
-        if self.scatter is not None:
-            self.scatter.set_offsets([[urgency, importance]])
-        if self.text is not None:
-            self.text.set_position((urgency, importance + 0.2))
-
-    def set_text(self, text):
-        """텍스트 설정"""
-        self.text = text
-
-    def set_scatter(self, scatter):
-        """산점도 점 설정"""
-        self.scatter = scatter
-
-    def highlight(self, highlight=True):
-        """점 강조/해제"""
-        if self.scatter is not None:
-            size = self.scatter.get_sizes()[0]
-            self.scatter.set_sizes([size * 1.2 if highlight else size / 1.2])
-        self.is_selected = highlight
+from .layout import LABEL_CELL_HEIGHT, LABEL_CELL_WIDTH, MatrixPoint, label_cells
+from .quadrant_background import QuadrantBackground
+from .spatial_index import GridIndex
 
 
 class Matrix:
@@ -42,51 +12,198 @@ class Matrix:
         self.base_font_size = base_font_size
         self.font_mult = 1.0
         self.points = []
+        self.points_by_id = {}  # 작업 id -> 점
+        self._ids = []
+        self._color_indices = None
+        self._allocation = None
+        self.labels = []  # 라벨 텍스트 (화면에 보이는 라벨 수만큼 유지하며 재사용)
+        self._label_winners = []  # 라벨마다 (점 번호, 가려진 점 수)
+        self._label_bounds = None  # 라벨을 배치할 때의 축 화면 영역
+        self._label_positions = None  # 라벨을 배치할 때의 점 위치 (복사본)
+        self._label_order = None  # 라벨을 배치할 때의 할당 시간 순서
+        self.sizes = np.empty(0)
+        self.index = GridIndex()  # 점 위치 색인 (적중 판정, 범위 선택)
         self._setup_quadrants()
+        self._setup_axes()
 
-    def draw(self, tasks, sorted_colors):
-        """매트릭스 그리기"""
-        # 기존 점들 제거
-        for point in self.points:
-            if point.scatter is not None:
-                point.scatter.remove()
-            if point.text is not None:
-                point.text.remove()
-        self.points.clear()
+        # 모든 작업의 점을 하나의 점 모음(PathCollection)으로 그림
+        # 오프셋/크기/색상 배열만 갱신하고 아티스트는 다시 만들지 않음
+        self.collection = self.ax.scatter(
+            np.empty(0), np.empty(0), picker=10, alpha=1.0)
+        self.offsets = self.collection.get_offsets()
 
-        # 축 설정
-        self._setup_axes()
+        # 끌고 있는 점 (드래그 중에는 점 모음 대신 이 점 하나만 다시 그림)
+        self.drag_marker = self.ax.scatter(
+            np.empty(0), np.empty(0), alpha=1.0, zorder=3)
+        self.drag_marker.set_visible(False)
+        self.drag_label = self._create_label()
+        self.drag_label.set_visible(False)
+        self.drag_point = None
 
-        if not tasks:
-            return
+    def draw(self, tasks, allocation):
+        """매트릭스 그리기 (작업 구성이 같으면 배열만 갱신)"""
+        rebuilt = allocation.ids != self._ids
+        if rebuilt:
+            self._rebuild_points(tasks, allocation)
+
+        # 위치는 바뀌었을 때만 설정 (총 시간만 바뀌면 크기와 라벨 글자만 갱신)
+        positions = np.column_stack(
+            (allocation.urgency, allocation.importance)).astype(float)
+        moved = rebuilt or not np.array_equal(positions, self.offsets)
+        if moved:
+            self.collection.set_offsets(positions)
+            self.offsets = self.collection.get_offsets()
+            self.index.build(self.offsets)
+        self.sizes = allocation.assigned * 10.0
+        self.collection.set_sizes(self.sizes)
+
+        # 색상은 바뀌었을 때만 다시 설정
+        if (self._color_indices is None or
+                not np.array_equal(self._color_indices, allocation.color_indices)):
+            colors = to_rgba_array(allocation.colors) if len(allocation) else np.empty((0, 4))
+            self.collection.set_facecolors(colors)
+            self.collection.set_edgecolors(colors)
+            self._color_indices = allocation.color_indices
+
+        self._allocation = allocation
+        # 칸마다 라벨을 붙일 점은 점 위치, 축 영역, 할당 시간의 순서로만 정해지므로
+        # 셋 다 마지막 배치 때와 같으면 라벨 글자만 갱신 (드래그 중 move_point가
+        # 오프셋 배열을 직접 바꾸므로 위치는 배치 때의 복사본과 비교)
+        order = np.argsort(-allocation.assigned, kind='stable')
+        if (self.ax.bbox.bounds != self._label_bounds or
+                self._label_positions is None or
+                not np.array_equal(positions, self._label_positions) or
+                not np.array_equal(order, self._label_order)):
+            self._label_order = order
+            self._layout_labels()
+        else:
+            self._update_label_texts()
+
+    def _rebuild_points(self, tasks, allocation):
+        """작업 구성이 바뀌었을 때 점 목록 다시 만들기"""
+        self.points = [MatrixPoint(self, index, task, color)
+                       for index, (task, color) in enumerate(zip(tasks, allocation.colors))]
+        self.points_by_id = {point.task_id: point for point in self.points}
+        self._ids = list(allocation.ids)
 
-        # 새로운 점들 생성
-        self.points = [MatrixPoint(task, color)
-                       for task, color in zip(tasks, sorted_colors)]
+    def _create_label(self):
+        """점 라벨 텍스트 만들기"""
+        return self.ax.text(
+            0, 0, '',
+            fontsize=self.base_font_size * self.font_mult,
+            ha='center',
+            clip_on=True  # 축 밖으로 나가면 blit 영역 밖에 잔상이 남음
+        )
 
-        # 점 그리기
+    def _label_text(self, index, hidden=0):
+        """점 라벨 내용 (가려진 점이 있으면 이름 뒤에 +N)"""
+        name = self._allocation.names[index]
+        minutes = int(self._allocation.assigned[index])
+        if hidden:
+            name = f'{name} +{hidden}'
+        return f'{name}\n{minutes // 60}시간 {minutes % 60}분'
+
+    def _layout_labels(self):
+        """라벨 배치: 화면을 라벨 크기의 격자로 나누고 칸마다 라벨 하나만 표시
+
+        같은 칸에 들어간 점들 중 할당 시간이 가장 큰 점(같으면 먼저 추가된 점)에만
+        라벨을 붙이고, 나머지 점의 수는 그 라벨에 "+N"으로 표시한다. 그리는
+        텍스트 수가 작업 수가 아니라 화면 크기에 비례하게 된다.
+        """
         for point in self.points:
-            scatter = self.ax.scatter(
-                point.task.urgency,
-                point.task.importance,
-                s=point.task.assigned_time * 10,
-                color=point.color,
-                picker=10,
-                alpha=1.0
-            )
-            point.set_scatter(scatter)
-
-            # 텍스트 추가
-            hours = point.task.assigned_time // 60
-            minutes = point.task.assigned_time % 60
-            text = self.ax.text(
-                point.task.urgency,
-                point.task.importance + 0.2,
-                f'{point.task.name}\n{hours}시간 {minutes}분',
-                fontsize=self.base_font_size * self.font_mult,
-                ha='center'
-            )
-            point.set_text(text)
+            point.text = None
+        self._label_bounds = self.ax.bbox.bounds
+        self._label_positions = np.array(self.offsets)
+        if not self.points:
+            self._label_winners = []
+            self._resize_labels(0)
+            return
+
+        # 라벨 기준점(점 위치)의 화면 좌표를 격자 칸으로
+        font_px = self.base_font_size * self.font_mult * self.ax.figure.dpi / 72
+        winners, cluster_sizes = label_cells(
+            self.ax.transData.transform(self.offsets), self._allocation.assigned,
+            font_px * LABEL_CELL_WIDTH, font_px * LABEL_CELL_HEIGHT)
+
+        self._resize_labels(len(winners))
+        self._label_winners = list(zip(winners.tolist(), (cluster_sizes - 1).tolist()))
+        for label, (index, hidden) in zip(self.labels, self._label_winners):
+            urgency, importance = self.offsets[index]
+            label.set_position((urgency, importance + 0.2))
+            label.set_text(self._label_text(index, hidden))
+            self.points[index].set_text(label)
+
+    def _update_label_texts(self):
+        """라벨 배치는 그대로 두고 글자(할당 시간)만 갱신"""
+        for label, (index, hidden) in zip(self.labels, self._label_winners):
+            label.set_text(self._label_text(index, hidden))
+
+    def _resize_labels(self, count):
+        """라벨 텍스트 수를 count에 맞춤"""
+        while len(self.labels) < count:
+            self.labels.append(self._create_label())
+        while len(self.labels) > count:
+            self.labels.pop().remove()
+
+    def dynamic_artists(self):
+        """매번 다시 그리는 아티스트 (점 모음, 점 라벨)"""
+        return [self.collection] + self.labels
+
+    def move_point(self, index, urgency, importance):
+        """점 모음의 오프셋 배열에서 점 하나만 이동"""
+        self.offsets[index] = (urgency, importance)
+        self.index.move(index, urgency, importance)
+        self.collection.stale = True
+        if self.drag_point is not None and self.drag_point.index == index:
+            self.drag_marker.set_offsets([[urgency, importance]])
+            self.drag_label.set_position((urgency, importance + 0.2))
+        elif self.points[index].text is not None:
+            self.points[index].text.set_position((urgency, importance + 0.2))
+
+    def scale_point(self, index, factor):
+        """점 하나의 크기 조절"""
+        self.sizes[index] *= factor
+        self.collection.set_sizes(self.sizes)
+
+    def begin_drag(self, point):
+        """드래그 시작: 점 모음에서 점을 숨기고 드래그용 점과 라벨로 대신 그림"""
+        self.drag_point = point
+        point.dragged_pos = self.offsets[point.index].tolist()
+        self.drag_marker.set_offsets([self.offsets[point.index]])
+        self.drag_marker.set_sizes([self.sizes[point.index]])
+        self.drag_marker.set_color(point.color)
+        self.drag_label.set_position((point.dragged_pos[0], point.dragged_pos[1] + 0.2))
+        self.drag_label.set_text(self._label_text(point.index))
+        self._drag_size = self.sizes[point.index]
+        self.sizes[point.index] = 0
+        self.collection.set_sizes(self.sizes)
+        if point.text is not None:
+            point.text.set_visible(False)
+        self.drag_marker.set_visible(True)
+        self.drag_label.set_visible(True)
+
+    def drag_artists(self):
+        """드래그 중 다른 아티스트 위에 덧그리는 아티스트 (드래그 중이 아니면 숨김)"""
+        return [self.drag_marker, self.drag_label]
+
+    def set_low_fidelity(self, enabled):
+        """드래그 중 저품질 모드: 점 라벨을 숨기고 점 모음의 안티앨리어싱을 끔"""
+        for label in self.labels:
+            label.set_visible(not enabled)
+        self.collection.set_antialiased(not enabled)
+
+    def end_drag(self):
+        """드래그 종료: 점 모음의 점 다시 표시"""
+        point, self.drag_point = self.drag_point, None
+        self.drag_marker.set_visible(False)
+        self.drag_label.set_visible(False)
+        if point is None:
+            return
+        if point.index < len(self.sizes):
+            self.sizes[point.index] = self._drag_size
+            self.collection.set_sizes(self.sizes)
+        if point.text is not None:
+            point.text.set_visible(True)
 
     def _setup_quadrants(self):
         """사분면 설정"""
@@ -108,52 +225,51 @@ class Matrix:
         ]
 
     def _setup_axes(self):
-        """축 설정"""
+        """축 설정 (처음 한 번만, 이후에는 폰트 크기만 갱신)"""
         self.ax.clear()
         self.ax.set_xlim(0, 6)
         self.ax.set_ylim(0, 6)
-        self.ax.set_xlabel(
-            "긴급도", fontsize=self.base_font_size * self.font_mult)
-        self.ax.set_ylabel(
-            "중요도", fontsize=self.base_font_size * self.font_mult)
-        self.ax.set_title(
-            "할 일", fontsize=self.base_font_size * self.font_mult * 1.5)
         self.ax.set_xticks([1, 2, 3, 4, 5])
         self.ax.set_yticks([1, 2, 3, 4, 5])
-        self.ax.grid(True, linestyle='--', alpha=0.3)
-
-        # 사분면 그리기
-        for (x, y), (ymin, ymax), label, color in self.quadrant_labels:
-            self.ax.text(
-                x, y, label,
-                fontsize=self.base_font_size * self.font_mult,
-                ha='center', va='center',
-                bbox={"facecolor": "white", "alpha": 0.7}
-            )
-            if x > 3:  # 오른쪽 영역
-                self.ax.axhspan(ymin, ymax, xmin=0.5, xmax=1.0,
-                                color=color, alpha=0.3)
-            else:  # 왼쪽 영역
-                self.ax.axhspan(ymin, ymax, xmin=0.0, xmax=0.5,
-                                color=color, alpha=0.3)
+
+        # 사분면 색 영역, 격자, 사분면 이름은 한 장의 이미지로 그려 두고 재사용
+        self.background = QuadrantBackground(
+            self.ax, self.quadrant_labels, self.base_font_size)
+        self.ax.add_image(self.background)
+        self.ax.set_xlim(0, 6)
+        self.ax.set_ylim(0, 6)
+        self._apply_font_size()
+
+    def _apply_font_size(self):
+        """축 라벨, 제목, 사분면 이름의 폰트 크기 적용"""
+        font_size = self.base_font_size * self.font_mult
+        self.ax.set_xlabel("긴급도", fontsize=font_size)
+        self.ax.set_ylabel("중요도", fontsize=font_size)
+        self.ax.set_title("할 일", fontsize=font_size * 1.5)
+        self.background.set_font_mult(self.font_mult)
+
+    def get_point(self, task_id):
+        """작업 id로 점 찾기"""
+        return self.points_by_id.get(task_id)
 
     def get_point_at_position(self, x, y):
         """주어진 위치에서 가장 가까운 점 찾기"""
-        if not self.points:
-            return None
+        index = self.index.nearest(x, y, 0.5)
+        return None if index is None else self.points[index]
 
-        distances = [
-            (point, np.sqrt((point.task.urgency - x)
-             ** 2 + (point.task.importance - y)**2))
-            for point in self.points
-        ]
-        closest_point, min_distance = min(distances, key=lambda x: x[1])
-        return closest_point if min_distance < 0.5 else None
+    def points_in_radius(self, x, y, radius):
+        """(x, y)에서 반경 안의 점 목록"""
+        return [self.points[i] for i in self.index.query_radius(x, y, radius).tolist()]
+
+    def points_in_rect(self, xmin, ymin, xmax, ymax):
+        """사각형 안의 점 목록 (범위 선택용)"""
+        return [self.points[i] for i in self.index.query_rect(xmin, ymin, xmax, ymax).tolist()]
 
     def update_font_size(self, font_mult):
-        """폰트 크기 업데이트"""
+        """폰트 크기 업데이트 (라벨 격자 크기도 바뀌므로 다시 배치)"""
         self.font_mult = font_mult
-        self._setup_axes()
-        for point in self.points:
-            if point.text is not None:
-                point.text.set_fontsize(self.base_font_size * self.font_mult)
+        self._apply_font_size()
+        for label in self.labels + [self.drag_label]:
+            label.set_fontsize(self.base_font_size * self.font_mult)
+        if self._allocation is not None:
+            self._layout_labels()
@@ -1,16 +1,15 @@
 # -*- coding: utf-8 -*-
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Button
-from matplotlib.patches import Circle, Rectangle
-from matplotlib.animation import FuncAnimation
-import time
-from datetime import datetime, timedelta
+from matplotlib.patches import Circle, Rectangle, Wedge
+from datetime import datetime
+
+from .layout import MIN_LABEL_ANGLE, OTHER_COLOR, pie_slices, wedge_angles
 
 
 class PieChart:
-    def __init__(self, ax, base_font_size):
+    def __init__(self, ax, base_font_size, max_wedges=12,
+                 expanded_max_wedges=48):
         self.ax = ax
         self.base_font_size = base_font_size
         self.font_mult = 1.0
@@ -21,113 +20,147 @@ class PieChart:
         self.reset_button = None
         self.timer_text = None
         self.timer_dot = None
-        self.animation = None
+        self.timer_source = None  # 1초 타이머 (처음 시작할 때 한 번만 만듦)
+        self.redraw_timer = None  # 타이머 점/텍스트만 다시 그리는 함수 (시각화 쪽에서 설정)
         self.button_text = None
         self.reset_text = None
         self.paused_time = None
+        self.wedges = []  # 부채꼴 (표시되는 작업 수만큼 유지하며 재사용)
+        self.labels = []  # 부채꼴 라벨
+        # 부채꼴 수 상한 (넘치는 작은 작업은 "기타"로, 펼친 상태에서는 expanded_max_wedges)
+        self.max_wedges = max_wedges
+        self.expanded_max_wedges = expanded_max_wedges
+        self.expanded = False  # "기타" 부채꼴을 클릭해 펼친 상태
+        self.other_wedge = None  # 현재 "기타" 부채꼴 (없으면 None)
+        self._last_draw = None
+        self.low_fidelity = False  # 드래그 중 미리보기: 부채꼴 라벨을 그리지 않음
+        self._setup_axes()
+
+    def _setup_axes(self):
+        """축과 타이머 구성 요소 설정 (처음 한 번만)"""
+        # ax.pie(radius=1.2)가 설정하던 것과 같은 축 범위
+        self.ax.set_aspect('equal')
+        self.ax.set(frame_on=False, xticks=[], yticks=[],
+                    xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
+
+        # 타이머 점
+        self.timer_dot = Circle((0, 1.2), 0.03, color='#00A0A0', zorder=2)
+        self.ax.add_patch(self.timer_dot)
+
+        # 타이머 텍스트
+        self.timer_text = self.ax.text(
+            0, 0.2,
+            '00:00:00',
+            ha='center', va='center',
+            fontsize=self.base_font_size * self.font_mult * 1.2,
+            color='#00A0A0'
+        )
 
-    def draw(self, tasks, available_hours, available_minutes_part, sorted_colors):
-        """파이 차트 그리기"""
-        self.ax.clear()
+        # 타이머 버튼
+        self.timer_button = Circle((0, 0), 0.08, color='#00A0A0', zorder=2)
+        self.ax.add_patch(self.timer_button)
+        self.button_text = self.ax.text(
+            0, 0,
+            '시작',
+            ha='center', va='center',
+            fontsize=self.base_font_size * self.font_mult * 0.8,
+            color='white'
+        )
 
-        if not tasks:
-            # 작업이 없을 때는 빈 파이 차트만 표시
-            self._set_title(available_hours, available_minutes_part)
-            return
+    def draw(self, allocation, available_hours, available_minutes_part):
+        """파이 차트 갱신 (부채꼴과 라벨은 재사용하고 각도와 글자만 바꿈)"""
+        self._last_draw = (allocation, available_hours, available_minutes_part)
+        self._set_title(available_hours, available_minutes_part)
 
-        # 할당 시간이 0보다 큰 작업만 선택
-        visible_tasks = [(task, color) for task, color in zip(tasks, sorted_colors)
-                         if task.assigned_time > 0]
+        # 정렬하고 할당 시간이 작은 작업은 "기타" 부채꼴 하나로 묶음 (부채꼴 수는 상한 이하)
+        if self.expanded:
+            slices = pie_slices(allocation, self.expanded_max_wedges)
+        else:
+            slices = pie_slices(allocation, self.max_wedges)
+        visible, times, other_count, self.total_minutes = slices
 
-        if not visible_tasks:
-            # 할당 시간이 0인 작업만 있을 때
-            self._set_title(available_hours, available_minutes_part)
-            return
+        # 표시되는 부채꼴 수가 바뀔 때만 부채꼴을 추가하거나 제거
+        self._resize_wedges(len(times))
+        self.other_wedge = self.wedges[-1] if other_count else None
 
-        # 긴급도와 중요도에 따라 정렬 (긴급하고 중요한 순서대로)
-        visible_tasks.sort(key=lambda x: (
-            x[0].urgency, x[0].importance), reverse=True)
-
-        # 파이 차트 데이터 준비
-        times = [task.assigned_time for task, _ in visible_tasks]
-        colors = [color for _, color in visible_tasks]
-
-        # 총 시간 계산 (분 단위)
-        self.total_minutes = sum(times)
-
-        # 파이 차트 그리기 (시계 방향으로)
-        wedges, _ = self.ax.pie(
-            times,
-            labels=None,
-            colors=colors,
-            startangle=90,
-            radius=1.2,
-            counterclock=False  # 시계 방향으로 그리기
-        )
+        # 작업이 없을 때는 빈 파이 차트(제목)만 표시
+        self._set_timer_visible(len(times) > 0)
+        if not len(times):
+            return
 
-        # 타이머 점 추가 (이미 존재하면 재사용)
-        if self.timer_dot is None:
-            self.timer_dot = Circle((0, 1.2), 0.03, color='#00A0A0')
-            self.ax.add_patch(self.timer_dot)
-        else:
-            self.ax.add_patch(self.timer_dot)
-
-        # 파이 차트에 텍스트 추가
-        for i, (wedge, (task, _)) in enumerate(zip(wedges, visible_tasks)):
-            angle = (wedge.theta2 + wedge.theta1) / 2
-            x_pos = 0.7 * np.cos(np.radians(angle))
-            y_pos = 0.7 * np.sin(np.radians(angle))
-            hours = task.assigned_time // 60
-            minutes = task.assigned_time % 60
-            self.ax.text(
-                x_pos, y_pos,
-                f'{task.name}\n\n{hours}시간 {minutes}분',
+        bounds = wedge_angles(times, self.total_minutes)
+        colors = allocation.colors
+        names = allocation.names
+        for wedge, label, index, minutes, theta2, theta1 in zip(
+                self.wedges, self.labels, visible.tolist() + [None], times.tolist(),
+                bounds[:-1].tolist(), bounds[1:].tolist()):
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            wedge.set_facecolor(OTHER_COLOR if index is None else colors[index])
+
+            # 파이 차트에 텍스트 추가 (읽을 수 없을 만큼 좁은 부채꼴은 생략)
+            label.set_visible(not self.low_fidelity and theta2 - theta1 >= MIN_LABEL_ANGLE)
+            if not label.get_visible():
+                continue
+            angle = np.radians((theta1 + theta2) / 2)
+            label.set_position((0.7 * np.cos(angle), 0.7 * np.sin(angle)))
+            name = f'기타 {other_count}개' if index is None else names[index]
+            label.set_text(f'{name}\n\n{minutes // 60}시간 {minutes % 60}분')
+
+    def set_low_fidelity(self, enabled):
+        """드래그 중 저품질 모드: 부채꼴 라벨을 숨기고 안티앨리어싱을 끔
+
+        라벨 글자 그리기가 미리보기 비용의 대부분이다. 끌 때는 다음 draw()에서
+        라벨이 다시 표시된다.
+        """
+        self.low_fidelity = enabled
+        for wedge, label in zip(self.wedges, self.labels):
+            wedge.set_antialiased(not enabled)
+            if enabled:
+                label.set_visible(False)
+
+    def toggle_expanded(self):
+        """"기타" 부채꼴 펼치기/접기"""
+        self.expanded = not self.expanded
+        if self._last_draw is not None:
+            self.draw(*self._last_draw)
+
+    def _resize_wedges(self, count):
+        """부채꼴과 라벨 수를 count에 맞춤"""
+        while len(self.wedges) < count:
+            wedge = Wedge((0, 0), 1.2, 90, 90, clip_on=False)
+            self.ax.add_patch(wedge)
+            self.wedges.append(wedge)
+            self.labels.append(self.ax.text(
+                0, 0, '',
                 ha='center', va='center',
                 fontsize=self.base_font_size * self.font_mult,
                 color='black'
-            )
-
-        self._set_title(available_hours, available_minutes_part)
-
-        # 타이머 텍스트 추가 (이미 존재하면 재사용)
-        if self.timer_text is None:
-            self.timer_text = self.ax.text(
-                0, 0.2,
-                '00:00:00',
-                ha='center', va='center',
-                fontsize=self.base_font_size * self.font_mult * 1.2,
-                color='#00A0A0'
-            )
-        else:
-            self.ax.add_artist(self.timer_text)
-
-        # 타이머 버튼 추가 (이미 존재하면 재사용)
-        if self.timer_button is None:
-            self.timer_button = Circle((0, 0), 0.08, color='#00A0A0')
-            self.ax.add_patch(self.timer_button)
-            self.button_text = self.ax.text(
-                0, 0,
-                '시작',
-                ha='center', va='center',
-                fontsize=self.base_font_size * self.font_mult * 0.8,
-                color='white'
-            )
-        else:
-            self.ax.add_patch(self.timer_button)
-            self.ax.add_artist(self.button_text)
-
-        # 초기화 버튼 추가 (이미 존재하면 재사용)
-        if self.reset_button is not None:
-            self.ax.add_patch(self.reset_button)
-            self.ax.add_artist(self.reset_text)
-
-        # 클릭 이벤트 연결
-        self.ax.figure.canvas.mpl_connect(
-            'button_press_event', self.on_button_click)
+            ))
+        while len(self.wedges) > count:
+            self.wedges.pop().remove()
+            self.labels.pop().remove()
+
+    def _set_timer_visible(self, visible):
+        """타이머 점, 텍스트, 버튼 표시/숨김"""
+        for artist in (self.timer_dot, self.timer_text, self.timer_button,
+                       self.button_text, self.reset_button, self.reset_text):
+            if artist is not None:
+                artist.set_visible(visible)
+
+    def dynamic_artists(self):
+        """매번 다시 그리는 아티스트 (부채꼴, 라벨, 버튼, 제목)"""
+        timer_artists = self.timer_artists()
+        return [artist for artist in [*self.ax.patches, *self.ax.texts]
+                if artist not in timer_artists] + [self.ax.title]
+
+    def timer_artists(self):
+        """1초마다 다시 그리는 아티스트 (다른 아티스트 위에 덧그림)"""
+        return [self.timer_dot, self.timer_text]
 
     def on_button_click(self, event):
         """버튼 클릭 이벤트 처리"""
-        if event.inaxes != self.ax:
+        if event.inaxes != self.ax or not self.wedges:  # 작업이 없으면 타이머도 숨겨져 있음
             return
 
         # 버튼 영역 확인 (원형)
@@ -146,6 +179,15 @@ class PieChart:
         # 초기화 버튼 클릭 확인
         if self.reset_button and -0.1 <= x <= 0.1 and -0.15 <= y <= -0.1:
             self.reset_timer()
+            return
+
+        # "기타" 부채꼴을 클릭하면 펼침, 펼친 상태에서 다시 클릭하면 접음
+        if distance > 0.08 and self.other_wedge is not None and \
+                self.other_wedge.contains(event)[0]:
+            self.toggle_expanded()
+        elif distance > 0.08 and self.expanded and distance <= 1.2 and \
+                self.other_wedge is None:
+            self.toggle_expanded()
 
     def start_timer(self):
         """타이머 시작"""
@@ -168,14 +210,11 @@ class PieChart:
             self.reset_button = None
             self.reset_text = None
 
-        # 애니메이션 시작
-        self.animation = FuncAnimation(
-            self.ax.figure,
-            self.update_timer,
-            interval=1000,  # 1초마다 업데이트
-            blit=False,
-            cache_frame_data=False  # 경고 해결
-        )
+        # 타이머 시작 (1초마다 업데이트, 타이머 객체는 재사용)
+        if self.timer_source is None:
+            self.timer_source = self.ax.figure.canvas.new_timer(interval=1000)
+            self.timer_source.add_callback(self._on_timer_tick)
+        self.timer_source.start()
 
     def stop_timer(self):
         """타이머 정지"""
@@ -187,15 +226,15 @@ class PieChart:
         if self.start_time:
             self.paused_time = datetime.now() - self.start_time
 
-        # 애니메이션 중지
-        if self.animation:
-            self.animation.event_source.stop()
+        # 타이머 중지 (일시정지 중에는 아무 작업도 하지 않음)
+        if self.timer_source is not None:
+            self.timer_source.stop()
 
         # 초기화 버튼 추가
         if not self.reset_button:
             self.reset_button = Rectangle(
                 (-0.1, -0.15), 0.2, 0.05,
-                color='#808080', alpha=0.8
+                color='#808080', alpha=0.8, zorder=2
             )
             self.ax.add_patch(self.reset_button)
 
@@ -229,9 +268,19 @@ class PieChart:
             self.reset_button = None
             self.reset_text = None
 
-        # 애니메이션 중지
-        if self.animation:
-            self.animation.event_source.stop()
+        # 타이머 중지
+        if self.timer_source is not None:
+            self.timer_source.stop()
+
+    def _on_timer_tick(self):
+        """1초마다 호출: 타이머 값 갱신 후 타이머 영역만 다시 그림"""
+        if not self.timer_running:
+            return
+        self.update_timer(None)
+        if self.redraw_timer is not None:
+            self.redraw_timer()
+        else:
+            self.ax.figure.canvas.draw_idle()
 
     def update_timer(self, frame):
         """타이머 업데이트"""
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+
+from ..font_cache import font_properties
+
+
+# (그림 크기, DPI, 기본 폰트 크기, 폰트 배수, 축 픽셀 크기, 사분면 정의) -> 사분면 배경 이미지
+_raster_cache = OrderedDict()
+_RASTER_CACHE_SIZE = 8
+
+
+def draw_quadrants(ax, quadrant_labels, font_size, zorder=None):
+    """사분면 색 영역, 격자, 사분면 이름을 ax(범위 0~6)에 그리고 아티스트 목록 반환"""
+    artists = []
+    # 격자 (1~5 눈금 위치)
+    for value in range(1, 6):
+        artists.append(ax.axhline(value, color='#b0b0b0', linewidth=0.8,
+                                  linestyle='--', alpha=0.3))
+        artists.append(ax.axvline(value, color='#b0b0b0', linewidth=0.8,
+                                  linestyle='--', alpha=0.3))
+
+    # 사분면 그리기
+    for (x, y), (ymin, ymax), label, color in quadrant_labels:
+        artists.append(ax.text(
+            x, y, label,
+            fontproperties=font_properties(font_size),
+            ha='center', va='center',
+            bbox={"facecolor": "white", "alpha": 0.7}
+        ))
+        if x > 3:  # 오른쪽 영역
+            artists.append(ax.axhspan(ymin, ymax, xmin=0.5, xmax=1.0, color=color, alpha=0.3))
+        else:  # 왼쪽 영역
+            artists.append(ax.axhspan(ymin, ymax, xmin=0.0, xmax=0.5, color=color, alpha=0.3))
+
+    if zorder is not None:
+        for artist in artists:
+            artist.set_zorder(zorder)
+    return artists
+
+
+def render_quadrants(width, height, dpi, quadrant_labels, font_size):
+    """사분면 배경(색 영역, 격자, 사분면 이름)을 width x height 픽셀 이미지로 그리기"""
+    fig = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_xlim(0, 6)
+    ax.set_ylim(0, 6)
+    ax.set_axis_off()
+    draw_quadrants(ax, quadrant_labels, font_size)
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+class QuadrantBackground(AxesImage):
+    """매트릭스 축의 정적인 사분면 배경 이미지
+
+    그릴 때마다 (그림 크기, DPI, 폰트 크기)를 확인하고, 바뀌었을 때만 배경을
+    다시 래스터화한다. 같은 조합의 이미지는 모듈 캐시에서 재사용한다.
+    """
+
+    def __init__(self, ax, quadrant_labels, base_font_size):
+        super().__init__(ax, extent=(0, 6, 0, 6), origin='upper',
+                         interpolation='nearest', zorder=0)
+        self.quadrant_labels = quadrant_labels
+        self.base_font_size = base_font_size
+        self.font_mult = 1.0
+        self.rasterizations = 0
+        self._key = None
+        self.set_data(np.zeros((1, 1, 4), dtype=np.uint8))
+
+    def set_font_mult(self, font_mult):
+        """사분면 이름의 폰트 배수 변경 (다음 그리기 때 반영)"""
+        self.font_mult = font_mult
+        self.stale = True
+
+    def _update_raster(self):
+        """현재 그림 크기, DPI, 폰트 배수에 맞는 배경 이미지 적용"""
+        fig = self.axes.figure
+        width = max(int(round(self.axes.bbox.width)), 1)
+        height = max(int(round(self.axes.bbox.height)), 1)
+        key = (tuple(fig.get_size_inches()), fig.dpi, self.base_font_size, self.font_mult,
+               width, height, tuple(self.quadrant_labels))
+        if key == self._key:
+            return
+        raster = _raster_cache.get(key)
+        if raster is None:
+            raster = render_quadrants(width, height, fig.dpi, self.quadrant_labels,
+                                      self.base_font_size * self.font_mult)
+            self.rasterizations += 1
+            _raster_cache[key] = raster
+            if len(_raster_cache) > _RASTER_CACHE_SIZE:
+                _raster_cache.popitem(last=False)
+        else:
+            _raster_cache.move_to_end(key)
+        self.set_data(raster)
+        self._key = key
+
+    def add_vector_artists(self):
+        """이미지와 같은 내용을 벡터 아티스트로 축에 추가하고 목록 반환 (SVG, PDF 저장용)
+
+        호출한 쪽에서 저장하는 동안 이미지를 숨기고, 저장 후 아티스트를 제거한다.
+        """
+        return draw_quadrants(self.axes, self.quadrant_labels,
+                              self.base_font_size * self.font_mult, zorder=self.get_zorder())
+
+    def draw(self, renderer):
+        self._update_raster()
+        super().draw(renderer)
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+
+class RenderBackend(ABC):
+    """렌더링 백엔드가 함께 따르는 형태 (MatplotlibBackend, SceneBackend의 부모)
+
+    - matrix, pie_chart: 매트릭스와 파이 차트 구성 요소. 매트릭스는 draw(tasks,
+      allocation), get_point_at_position(x, y), begin_drag/end_drag,
+      set_low_fidelity, update_font_size를, 파이 차트는 draw(allocation,
+      hours, minutes_part)와 update_font_size를 제공한다. 점은 MatrixPoint이다.
+    - update(): 할당 결과 전체를 그림
+    - preview(): 파이 차트만 다시 그림 (드래그 중 미리보기)
+    - begin_drag()/render_drag()/end_drag(): 점 끌기 시작, 끌고 있는 점만 다시
+      그리기, 끌기 끝
+    - schedule()/cancel(): 슬라이더와 드래그 갱신을 그리기 프레임에 맞춰 처리
+    - stop(): 창을 닫을 때 타이머 정리
+
+    컨트롤러(TaskController)는 이 메서드만 쓰므로 백엔드를 바꿔 끼울 수 있다.
+    update()와 preview()는 반드시 구현해야 하고 (없으면 만들 때 TypeError),
+    나머지 기본 구현은 항목을 유지하는 백엔드에 맞춰 요청을 바로 처리한다.
+    """
+
+    name = None
+    matrix = None
+    pie_chart = None
+
+    @abstractmethod
+    def update(self, tasks, allocation, available_hours, available_minutes_part):
+        """파이 차트와 매트릭스 갱신"""
+
+    @abstractmethod
+    def preview(self, allocation, available_hours, available_minutes_part):
+        """파이 차트만 갱신"""
+
+    def begin_drag(self, point):
+        """점 끌기 시작 (드래그 중에는 저품질 모드)"""
+        self.matrix.begin_drag(point)
+        self.matrix.set_low_fidelity(True)
+
+    def render_drag(self):
+        """끌고 있는 점만 다시 그림"""
+
+    def end_drag(self):
+        """점 끌기 끝"""
+        self.matrix.end_drag()
+        self.matrix.set_low_fidelity(False)
+
+    def schedule(self, name, callback, *args):
+        """갱신 요청 (기본은 바로 처리)"""
+        callback(*args)
+
+    def cancel(self, name):
+        """처리되지 않은 갱신 요청 버리기"""
+
+    def stop(self):
+        """타이머 정리"""
@@ -0,0 +1,162 @@
+import time
+
+import numpy as np
+from matplotlib.transforms import Bbox
+
+from .stats import FRAME_BUDGET, FrameStats
+
+
+class RenderLayer:
+    """화면의 한 영역과 그 영역에서 매번 다시 그리는 아티스트들"""
+
+    def __init__(self, name, ax, artists, extent_artists=None, overlay=None, padding=4):
+        self.name = name
+        self.ax = ax
+        self.artists = artists  # 동적 아티스트 목록을 돌려주는 함수
+        self.extent_artists = extent_artists  # 축 밖으로 나가는 아티스트 (제목 등)
+        self.overlay = overlay  # 동적 아티스트 위에 덧그리는 아티스트 목록을 돌려주는 함수
+        self.padding = padding
+        self.region = None
+        self.background = None
+        self.composed = None  # 덧그리기 전까지 그린 영역
+        self.overlay_extent = None  # 마지막으로 덧그린 아티스트들의 범위
+
+    def all_artists(self):
+        """이 영역에서 전체 그리기에서 빼야 하는 아티스트"""
+        artists = list(self.artists())
+        if self.overlay is not None:
+            artists += self.overlay()
+        return artists
+
+    def capture(self, canvas, renderer):
+        """동적 아티스트를 뺀 배경 저장"""
+        boxes = [self.ax.bbox]
+        if self.extent_artists is not None:
+            boxes += [artist.get_window_extent(renderer)
+                      for artist in self.extent_artists() if artist.get_visible()]
+        region = Bbox.union(boxes).padded(self.padding)
+        # 캔버스 밖으로 나가지 않게 자름
+        self.region = Bbox.intersection(region, canvas.figure.bbox) or region
+        self.background = canvas.copy_from_bbox(self.region)
+
+    def draw(self, canvas):
+        """동적 아티스트를 zorder 순서로 그리기 (덧그릴 아티스트는 마지막에)
+
+        숨긴 아티스트(드래그 중의 점 라벨 등)는 건너뛴다.
+        """
+        artists = [artist for artist in self.artists() if artist.get_visible()]
+        for artist in sorted(artists, key=lambda artist: artist.get_zorder()):
+            self.ax.draw_artist(artist)
+        if self.overlay is not None:
+            self.composed = canvas.copy_from_bbox(self.region)
+            self.draw_overlay(canvas)
+
+    def draw_overlay(self, canvas):
+        """덧그릴 아티스트만 그리고 그린 범위 반환"""
+        renderer = canvas.get_renderer()
+        boxes = []
+        for artist in self.overlay():
+            self.ax.draw_artist(artist)
+            if artist.get_visible():
+                boxes.append(artist.get_window_extent(renderer))
+        extent = Bbox.union(boxes).padded(2) if boxes else None
+        previous, self.overlay_extent = self.overlay_extent, extent
+        return previous, extent
+
+
+class BlitRenderer:
+    """정적인 배경과 동적인 아티스트를 나눠 그리는 렌더링 파이프라인
+
+    축, 사분면 배경, 격자, 위젯처럼 잘 바뀌지 않는 부분은 전체 그리기
+    (canvas.draw) 때만 그리고 영역별 배경으로 저장한다. 점, 부채꼴, 라벨처럼
+    자주 바뀌는 아티스트는 animated로 표시해 전체 그리기에서 빼고, render()
+    때 저장한 배경을 복원한 뒤 그 위에만 다시 그려 바뀐 영역만 blit한다.
+    """
+
+    def __init__(self, canvas, budget=FRAME_BUDGET):
+        self.canvas = canvas
+        self.layers = {}
+        self.stats = FrameStats(budget)
+        self.full_draws = 0
+        self._valid = False
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_layer(self, name, ax, artists, extent_artists=None, overlay=None):
+        """영역 추가 (artists는 그 영역의 동적 아티스트 목록을 돌려주는 함수)"""
+        self.layers[name] = RenderLayer(name, ax, artists, extent_artists, overlay)
+        self._mark_animated()
+        self._valid = False
+
+    def _mark_animated(self):
+        """동적 아티스트를 전체 그리기에서 제외 (새로 표시한 것이 있으면 True)"""
+        changed = False
+        for layer in self.layers.values():
+            for artist in layer.all_artists():
+                if not artist.get_animated():
+                    artist.set_animated(True)
+                    changed = True
+        return changed
+
+    def _on_draw(self, event):
+        """전체 그리기 직후: 영역별 배경을 다시 저장하고 동적 아티스트 그리기"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self.full_draws += 1
+        if self._mark_animated():
+            # 새로 만든 아티스트가 배경에 그려졌으므로 다시 그림
+            self._valid = False
+            self.canvas.draw_idle()
+            return
+        renderer = self.canvas.get_renderer()
+        for layer in self.layers.values():
+            layer.capture(self.canvas, renderer)
+        for layer in self.layers.values():
+            layer.draw(self.canvas)
+        self._valid = True
+
+    @property
+    def valid(self):
+        """저장한 배경 위에 동적 아티스트까지 그려진 상태인지 여부"""
+        return self._valid
+
+    def invalidate(self):
+        """정적인 부분이 바뀌었을 때 전체 다시 그리기 예약"""
+        self._valid = False
+        self.canvas.draw_idle()
+
+    def render(self, *names):
+        """지정한 영역(없으면 전체)의 동적 아티스트만 다시 그려 blit"""
+        start = time.perf_counter()
+        # 새로 만든 아티스트는 아직 배경에 그려진 적이 없으므로 표시만 하면 됨
+        self._mark_animated()
+        if not self._valid:
+            # 배경이 없거나 낡았으면 전체 그리기 (draw_event에서 동적 부분까지 그림)
+            self.canvas.draw()
+        else:
+            layers = [self.layers[name] for name in names] if names else self.layers.values()
+            for layer in layers:
+                self.canvas.restore_region(layer.background)
+                layer.draw(self.canvas)
+                self.canvas.blit(layer.region)
+        self.stats.record(time.perf_counter() - start)
+
+    def render_overlay(self, name):
+        """덧그리는 아티스트만 다시 그려, 이전 위치와 새 위치를 합친 범위만 blit
+
+        영역의 나머지 부분은 마지막 render() 때 저장해 둔 것을 복원하므로
+        타이머처럼 작은 아티스트 몇 개만 움직일 때 비용이 거의 없다.
+        """
+        layer = self.layers[name]
+        if not self._valid or layer.composed is None:
+            self.render(name)
+            return
+        self.canvas.restore_region(layer.composed)
+        previous, extent = layer.draw_overlay(self.canvas)
+        boxes = [box for box in (previous, extent) if box is not None]
+        if boxes:
+            self.canvas.blit(Bbox.intersection(Bbox.union(boxes), layer.region)
+                             or layer.region)
+
+    def disconnect(self):
+        """draw_event 연결 해제"""
+        self.canvas.mpl_disconnect(self._cid)
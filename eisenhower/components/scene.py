@@ -0,0 +1,453 @@
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QPen
+from PyQt5.QtWidgets import (QGraphicsEllipseItem, QGraphicsRectItem, QGraphicsScene,
+                             QGraphicsSimpleTextItem)
+
+from ..font_cache import qt_font
+from .layout import (LABEL_CELL_HEIGHT, LABEL_CELL_WIDTH, MIN_LABEL_ANGLE, OTHER_COLOR,
+                     MatrixPoint, label_cells, pie_slices, wedge_angles)
+from .render_backend import RenderBackend
+
+
+# 장면 좌표 한 단위의 크기 (px): 매트릭스 긴급도/중요도 1칸, 파이 차트 반지름 1
+MATRIX_SCALE = 80
+PIE_SCALE = 200
+
+# matplotlib 그림과 같은 글자/점 크기를 쓰기 위한 해상도
+SCENE_DPI = 100
+
+# 장면에서 파이 차트 중심과 매트릭스 왼쪽 위 모서리 위치
+PIE_CENTER = (300, 330)
+MATRIX_ORIGIN = (700, 90)
+
+
+def _font(size_pt):
+    """pt 단위 크기를 장면 px 크기로 바꾼 번들 글꼴"""
+    return qt_font(max(1, int(round(size_pt * SCENE_DPI / 72))))
+
+
+def _center_text(item, x, y):
+    """텍스트 항목의 가운데를 (x, y)에 맞춤"""
+    rect = item.boundingRect()
+    item.setPos(x - rect.width() / 2, y - rect.height() / 2)
+
+
+class SceneMatrix:
+    """QGraphicsScene에 그리는 매트릭스 (Matrix와 같은 인터페이스)
+
+    작업마다 원 항목 하나를 유지하고 위치/크기/색만 바꾼다. 적중 판정은 장면의
+    BSP 색인(scene.items)으로 후보를 찾고, 바뀐 항목의 영역만 다시 그리는 것은
+    QGraphicsView가 맡는다.
+    """
+
+    def __init__(self, scene, base_font_size, origin=MATRIX_ORIGIN):
+        self.scene = scene
+        self.base_font_size = base_font_size
+        self.font_mult = 1.0
+        self.origin = origin
+        self.points = []
+        self.points_by_id = {}
+        self.items = []  # 작업마다 원 항목 하나
+        self.labels = []  # 라벨 텍스트 항목 (화면에 보이는 라벨 수만큼 유지하며 재사용)
+        self.offsets = np.empty((0, 2))
+        self.sizes = np.empty(0)
+        self.drag_point = None
+        self._ids = []
+        self._color_indices = None
+        self._allocation = None
+        self._setup_quadrants()
+
+        # 끌고 있는 점의 라벨
+        self.drag_label = self._create_label()
+        self.drag_label.setZValue(4)
+        self.drag_label.setVisible(False)
+
+    def to_scene(self, urgency, importance):
+        """(긴급도, 중요도) -> 장면 좌표"""
+        return (self.origin[0] + urgency * MATRIX_SCALE,
+                self.origin[1] + (6 - importance) * MATRIX_SCALE)
+
+    def from_scene(self, x, y):
+        """장면 좌표 -> (긴급도, 중요도)"""
+        return ((x - self.origin[0]) / MATRIX_SCALE,
+                6 - (y - self.origin[1]) / MATRIX_SCALE)
+
+    def contains(self, x, y):
+        """장면 좌표가 매트릭스 영역 안인지"""
+        urgency, importance = self.from_scene(x, y)
+        return 0 <= urgency <= 6 and 0 <= importance <= 6
+
+    def _setup_quadrants(self):
+        """사분면 색 영역, 격자, 사분면 이름, 축 이름 (한 번만 만드는 정적 항목)"""
+        quadrants = [
+            ((3, 6), (6, 3), "긴급 & 중요", '#FFB3BA', (5.5, 5.7)),
+            ((0, 6), (3, 3), "중요하지만 덜 긴급", '#FFDFBA', (0.7, 5.7)),
+            ((3, 3), (6, 0), "긴급하지만 덜 중요", '#BAFFC9', (5.3, 0.3)),
+            ((0, 3), (3, 0), "덜 중요 & 덜 긴급", '#BAE1FF', (0.7, 0.3)),
+        ]
+        self.static_texts = []
+        for top_left, bottom_right, label, color, label_pos in quadrants:
+            x0, y0 = self.to_scene(*top_left)
+            x1, y1 = self.to_scene(*bottom_right)
+            fill = QColor(color)
+            fill.setAlphaF(0.3)
+            rect = QGraphicsRectItem(QRectF(x0, y0, x1 - x0, y1 - y0))
+            rect.setBrush(QBrush(fill))
+            rect.setPen(QPen(Qt.NoPen))
+            self.scene.addItem(rect)
+            text = QGraphicsSimpleTextItem(label)
+            text.setZValue(1)
+            self.scene.addItem(text)
+            self.static_texts.append((text, self.to_scene(*label_pos), 1.0))
+
+        grid = QPen(QColor('#b0b0b0'), 0.8, Qt.DashLine)
+        for value in range(1, 6):
+            self.scene.addLine(*self.to_scene(value, 0), *self.to_scene(value, 6), grid)
+            self.scene.addLine(*self.to_scene(0, value), *self.to_scene(6, value), grid)
+        self.scene.addRect(QRectF(*self.to_scene(0, 6), 6 * MATRIX_SCALE, 6 * MATRIX_SCALE))
+
+        for value in range(1, 6):
+            for position in ((value, -0.15), (-0.15, value)):
+                text = self.scene.addSimpleText(str(value))
+                self.static_texts.append((text, self.to_scene(*position), 1.0))
+        for label, position, scale in (("할 일", (3, 6.45), 1.5),
+                                       ("긴급도", (3, -0.45), 1.0)):
+            text = self.scene.addSimpleText(label)
+            self.static_texts.append((text, self.to_scene(*position), scale))
+        ylabel = self.scene.addSimpleText("중요도")
+        ylabel.setRotation(-90)
+        self.ylabel = ylabel
+        self._apply_font_size()
+
+    def _apply_font_size(self):
+        """정적 텍스트의 폰트 크기 적용"""
+        font_size = self.base_font_size * self.font_mult
+        for text, (x, y), scale in self.static_texts:
+            text.setFont(_font(font_size * scale))
+            _center_text(text, x, y)
+        self.ylabel.setFont(_font(font_size))
+        x, y = self.to_scene(-0.45, 3)
+        rect = self.ylabel.boundingRect()
+        self.ylabel.setPos(x - rect.height() / 2, y + rect.width() / 2)
+
+    def draw(self, tasks, allocation):
+        """매트릭스 그리기 (작업 구성이 같으면 항목의 위치/크기만 갱신)"""
+        if allocation.ids != self._ids:
+            self._rebuild_points(tasks, allocation)
+
+        self.offsets = np.column_stack(
+            (allocation.urgency, allocation.importance)).astype(float)
+        self.sizes = allocation.assigned * 10.0
+        recolor = (self._color_indices is None or
+                   not np.array_equal(self._color_indices, allocation.color_indices))
+        for index, item in enumerate(self.items):
+            self._place(index)
+            if recolor:
+                color = QColor(allocation.colors[index])
+                item.setBrush(QBrush(color))
+                item.setPen(QPen(color))
+        self._color_indices = allocation.color_indices
+
+        self._allocation = allocation
+        self._layout_labels()
+
+    def _place(self, index):
+        """항목 하나의 위치와 크기를 배열 값에 맞춤 (크기는 scatter의 면적과 같게)"""
+        radius = np.sqrt(self.sizes[index]) * SCENE_DPI / 72 / 2
+        item = self.items[index]
+        item.setRect(-radius, -radius, 2 * radius, 2 * radius)
+        item.setPos(*self.to_scene(*self.offsets[index]))
+
+    def _rebuild_points(self, tasks, allocation):
+        """작업 구성이 바뀌었을 때 점과 항목 다시 만들기"""
+        for item in self.items:
+            self.scene.removeItem(item)
+        self.items = []
+        for index in range(len(allocation)):
+            item = QGraphicsEllipseItem()
+            item.setZValue(2)
+            item.setData(0, index)
+            self.scene.addItem(item)
+            self.items.append(item)
+        self.points = [MatrixPoint(self, index, task, color)
+                       for index, (task, color) in enumerate(zip(tasks, allocation.colors))]
+        self.points_by_id = {point.task_id: point for point in self.points}
+        self._ids = list(allocation.ids)
+        self._color_indices = None
+
+    def _create_label(self):
+        """점 라벨 텍스트 항목 만들기"""
+        label = QGraphicsSimpleTextItem()
+        label.setFont(_font(self.base_font_size * self.font_mult))
+        label.setZValue(3)
+        self.scene.addItem(label)
+        return label
+
+    def _label_text(self, index, hidden=0):
+        """점 라벨 내용 (가려진 점이 있으면 이름 뒤에 +N)"""
+        name = self._allocation.names[index]
+        minutes = int(self._allocation.assigned[index])
+        if hidden:
+            name = f'{name} +{hidden}'
+        return f'{name}\n{minutes // 60}시간 {minutes % 60}분'
+
+    def _set_label(self, label, urgency, importance, text=None):
+        """라벨을 점 위에 배치"""
+        if text is not None:
+            label.setText(text)
+        x, y = self.to_scene(urgency, importance + 0.2)
+        rect = label.boundingRect()
+        label.setPos(x - rect.width() / 2, y - rect.height())
+
+    def _layout_labels(self):
+        """라벨 배치 (Matrix와 같이 화면 격자 칸마다 라벨 하나)"""
+        for point in self.points:
+            point.text = None
+        if not self.points:
+            self._resize_labels(0)
+            return
+
+        font_px = self.base_font_size * self.font_mult * SCENE_DPI / 72
+        screen = np.column_stack(self.to_scene(self.offsets[:, 0], self.offsets[:, 1]))
+        winners, cluster_sizes = label_cells(
+            screen, self._allocation.assigned,
+            font_px * LABEL_CELL_WIDTH, font_px * LABEL_CELL_HEIGHT)
+
+        self._resize_labels(len(winners))
+        for label, index, cluster_size in zip(self.labels, winners.tolist(),
+                                              cluster_sizes.tolist()):
+            self._set_label(label, *self.offsets[index],
+                            text=self._label_text(index, cluster_size - 1))
+            self.points[index].set_text(label)
+
+    def _resize_labels(self, count):
+        """라벨 항목 수를 count에 맞춤"""
+        while len(self.labels) < count:
+            self.labels.append(self._create_label())
+        while len(self.labels) > count:
+            self.scene.removeItem(self.labels.pop())
+
+    def move_point(self, index, urgency, importance):
+        """항목 하나만 이동 (장면이 이전/새 위치만 다시 그림)"""
+        self.offsets[index] = (urgency, importance)
+        self.items[index].setPos(*self.to_scene(urgency, importance))
+        if self.drag_point is not None and self.drag_point.index == index:
+            self._set_label(self.drag_label, urgency, importance)
+        elif self.points[index].text is not None:
+            self._set_label(self.points[index].text, urgency, importance)
+
+    def scale_point(self, index, factor):
+        """점 하나의 크기 조절"""
+        self.sizes[index] *= factor
+        self._place(index)
+
+    def begin_drag(self, point):
+        """드래그 시작: 항목을 맨 위로 올리고 드래그용 라벨 표시"""
+        self.drag_point = point
+        point.dragged_pos = self.offsets[point.index].tolist()
+        self.items[point.index].setZValue(3)
+        if point.text is not None:
+            point.text.setVisible(False)
+        self.drag_label.setText(self._label_text(point.index))
+        self._set_label(self.drag_label, *point.dragged_pos)
+        self.drag_label.setVisible(True)
+
+    def set_low_fidelity(self, enabled):
+        """드래그 중 저품질 모드: 점 라벨 숨김"""
+        for label in self.labels:
+            label.setVisible(not enabled)
+
+    def end_drag(self):
+        """드래그 종료"""
+        point, self.drag_point = self.drag_point, None
+        self.drag_label.setVisible(False)
+        if point is None or point.index >= len(self.items):
+            return
+        self.items[point.index].setZValue(2)
+        if point.text is not None:
+            point.text.setVisible(True)
+
+    def get_point(self, task_id):
+        """작업 id로 점 찾기"""
+        return self.points_by_id.get(task_id)
+
+    def get_point_at_position(self, x, y):
+        """주어진 위치에서 가장 가까운 점 찾기 (0.5 이내, 거리가 같으면 번호가 작은 점)"""
+        candidates = self._indices_in_rect(x - 0.5, y - 0.5, x + 0.5, y + 0.5)
+        if not len(candidates):
+            return None
+        distances = np.hypot(self.offsets[candidates, 0] - x,
+                             self.offsets[candidates, 1] - y)
+        best = distances.min()
+        if best >= 0.5:
+            return None
+        return self.points[int(candidates[distances == best].min())]
+
+    def _indices_in_rect(self, xmin, ymin, xmax, ymax):
+        """장면 BSP 색인으로 사각형에 걸친 점 번호 찾기"""
+        x0, y0 = self.to_scene(xmin, ymax)
+        x1, y1 = self.to_scene(xmax, ymin)
+        items = self.scene.items(QRectF(x0, y0, x1 - x0, y1 - y0),
+                                 Qt.IntersectsItemBoundingRect)
+        indices = [item.data(0) for item in items if item.data(0) is not None]
+        return np.array(sorted(indices), dtype=np.intp)
+
+    def points_in_rect(self, xmin, ymin, xmax, ymax):
+        """사각형 안의 점 목록 (범위 선택용)"""
+        xmin, xmax = min(xmin, xmax), max(xmin, xmax)
+        ymin, ymax = min(ymin, ymax), max(ymin, ymax)
+        candidates = self._indices_in_rect(xmin, ymin, xmax, ymax)
+        if not len(candidates):
+            return []
+        x, y = self.offsets[candidates, 0], self.offsets[candidates, 1]
+        inside = candidates[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)]
+        return [self.points[i] for i in inside.tolist()]
+
+    def update_font_size(self, font_mult):
+        """폰트 크기 업데이트 (라벨 격자 크기도 바뀌므로 다시 배치)"""
+        self.font_mult = font_mult
+        self._apply_font_size()
+        for label in self.labels + [self.drag_label]:
+            label.setFont(_font(self.base_font_size * self.font_mult))
+        if self._allocation is not None:
+            self._layout_labels()
+
+
+class ScenePieChart:
+    """QGraphicsScene에 그리는 파이 차트 (PieChart와 같은 조각 계산과 각도)"""
+
+    def __init__(self, scene, base_font_size, center=PIE_CENTER, max_wedges=12,
+                 expanded_max_wedges=48):
+        self.scene = scene
+        self.base_font_size = base_font_size
+        self.font_mult = 1.0
+        self.center = center
+        self.max_wedges = max_wedges
+        self.expanded_max_wedges = expanded_max_wedges
+        self.expanded = False
+        self.total_minutes = 0
+        self.wedges = []  # 부채꼴 항목 (표시되는 작업 수만큼 유지하며 재사용)
+        self.labels = []
+        self.other_wedge = None
+        self._last_draw = None
+        self.title = scene.addSimpleText('')
+        self.title.setFont(_font(base_font_size * 1.5))
+
+    def draw(self, allocation, available_hours, available_minutes_part):
+        """파이 차트 갱신 (부채꼴과 라벨은 재사용하고 각도와 글자만 바꿈)"""
+        self._last_draw = (allocation, available_hours, available_minutes_part)
+        self.title.setText(f"오늘의 일정 (총 {available_hours}시간 {available_minutes_part}분)")
+        _center_text(self.title, self.center[0], self.center[1] - 1.25 * PIE_SCALE - 30)
+
+        if self.expanded:
+            slices = pie_slices(allocation, self.expanded_max_wedges)
+        else:
+            slices = pie_slices(allocation, self.max_wedges)
+        visible, times, other_count, self.total_minutes = slices
+
+        self._resize_wedges(len(times))
+        self.other_wedge = self.wedges[-1] if other_count else None
+        if not len(times):
+            return
+
+        bounds = wedge_angles(times, self.total_minutes)
+        colors = allocation.colors
+        names = allocation.names
+        for wedge, label, index, minutes, theta2, theta1 in zip(
+                self.wedges, self.labels, visible.tolist() + [None], times.tolist(),
+                bounds[:-1].tolist(), bounds[1:].tolist()):
+            # Qt 각도도 3시 방향에서 반시계 방향이며 1/16도 단위
+            wedge.setStartAngle(int(round(theta1 * 16)))
+            wedge.setSpanAngle(int(round((theta2 - theta1) * 16)))
+            color = QColor(OTHER_COLOR if index is None else colors[index])
+            wedge.setBrush(QBrush(color))
+
+            label.setVisible(theta2 - theta1 >= MIN_LABEL_ANGLE)
+            if not label.isVisible():
+                continue
+            angle = np.radians((theta1 + theta2) / 2)
+            name = f'기타 {other_count}개' if index is None else names[index]
+            label.setText(f'{name}\n\n{minutes // 60}시간 {minutes % 60}분')
+            _center_text(label,
+                         self.center[0] + 0.7 * PIE_SCALE * np.cos(angle),
+                         self.center[1] - 0.7 * PIE_SCALE * np.sin(angle))
+
+    def _resize_wedges(self, count):
+        """부채꼴과 라벨 수를 count에 맞춤"""
+        radius = 1.2 * PIE_SCALE
+        while len(self.wedges) < count:
+            wedge = QGraphicsEllipseItem(self.center[0] - radius, self.center[1] - radius,
+                                         2 * radius, 2 * radius)
+            wedge.setPen(QPen(Qt.NoPen))
+            self.scene.addItem(wedge)
+            label = QGraphicsSimpleTextItem()
+            label.setFont(_font(self.base_font_size * self.font_mult))
+            label.setZValue(1)
+            self.scene.addItem(label)
+            self.wedges.append(wedge)
+            self.labels.append(label)
+        while len(self.wedges) > count:
+            self.scene.removeItem(self.wedges.pop())
+            self.scene.removeItem(self.labels.pop())
+
+    def contains(self, x, y):
+        """장면 좌표가 파이 차트 원 안인지"""
+        return np.hypot(x - self.center[0], y - self.center[1]) <= 1.2 * PIE_SCALE
+
+    def on_click(self, x, y):
+        """"기타" 부채꼴을 클릭하면 펼침, 펼친 상태에서 원 안을 다시 클릭하면 접음"""
+        if self.other_wedge is not None:
+            if self.other_wedge.contains(QPointF(x, y)):
+                self.toggle_expanded()
+        elif self.expanded and self.contains(x, y):
+            self.toggle_expanded()
+
+    def toggle_expanded(self):
+        """"기타" 부채꼴 펼치기/접기"""
+        self.expanded = not self.expanded
+        if self._last_draw is not None:
+            self.draw(*self._last_draw)
+
+    def update_font_size(self, font_mult):
+        """폰트 크기 업데이트"""
+        self.font_mult = font_mult
+        self.title.setFont(_font(self.base_font_size * font_mult * 1.5))
+        for label in self.labels:
+            label.setFont(_font(self.base_font_size * font_mult))
+        if self._last_draw is not None:
+            self.draw(*self._last_draw)
+
+
+class SceneBackend(RenderBackend):
+    """QGraphicsScene 렌더링 백엔드
+
+    항목을 유지하는 방식이라 바뀐 항목의 영역만 다시 그려지며, 여러 번 바뀌어도
+    다음 그리기 때 한 번에 그려진다. 그래서 갱신 요청은 바로 처리하고
+    render_drag()는 할 일이 없다 (RenderBackend의 기본 구현).
+    """
+
+    name = 'scene'
+
+    def __init__(self, scene, base_font_size):
+        self.scene = scene
+        self.pie_chart = ScenePieChart(scene, base_font_size)
+        self.matrix = SceneMatrix(scene, base_font_size)
+
+    def update(self, tasks, allocation, available_hours, available_minutes_part):
+        """파이 차트와 매트릭스 항목 갱신"""
+        self.pie_chart.draw(allocation, available_hours, available_minutes_part)
+        self.matrix.draw(tasks, allocation)
+
+    def preview(self, allocation, available_hours, available_minutes_part):
+        """파이 차트 항목만 갱신"""
+        self.pie_chart.draw(allocation, available_hours, available_minutes_part)
+
+
+def create_scene():
+    """흰 배경의 장면 만들기"""
+    scene = QGraphicsScene()
+    scene.setBackgroundBrush(QBrush(Qt.white))
+    scene.setSceneRect(QRectF(0, 0, MATRIX_ORIGIN[0] + 7 * MATRIX_SCALE,
+                              PIE_CENTER[1] + 1.5 * PIE_SCALE))
+    return scene
@@ -0,0 +1,95 @@
+import time
+from collections import Counter
+
+from .stats import FRAME_BUDGET
+
+
+class FrameScheduler:
+    """입력 이벤트를 모아 한 프레임에 한 번만 처리하는 스케줄러
+
+    같은 이름으로 들어온 요청은 마지막 것만 남기고(합치기), 직전 프레임이 끝난 뒤
+    interval이 지났으면 바로 처리하고, 아니면 남은 시간 뒤에 타이머로 처리한다.
+    그리기가 interval보다 오래 걸려도 프레임 사이에 이벤트를 모을 시간이 생긴다.
+    그래서 빠르게 움직이다 멈춰도 마지막 값은 항상 그려진다. 처리되기 전에
+    취소된 요청은 버린 것으로 센다.
+    """
+
+    def __init__(self, canvas, interval=FRAME_BUDGET):
+        self.interval = interval
+        self.pending = {}  # 이름 -> (콜백, 인자), 요청이 들어온 순서대로
+        self.requests = Counter()  # 이름 -> 요청 수
+        self.coalesced = Counter()  # 이름 -> 처리 전에 새 요청으로 대체된 수
+        self.dropped = Counter()  # 이름 -> 처리 전에 취소된 수
+        self.frames = 0
+        self._last_frame = None  # 직전 프레임이 끝난 시각
+        self._in_frame = False
+        self._armed = False
+        self._timer = canvas.new_timer(interval=int(interval * 1000))
+        self._timer.single_shot = True
+        self._timer.add_callback(self._on_timer)
+
+    def request(self, name, callback, *args):
+        """이름별 최신 요청으로 등록하고, 필요하면 이번 프레임을 처리"""
+        self.requests[name] += 1
+        if name in self.pending:
+            self.coalesced[name] += 1
+        self.pending[name] = (callback, args)
+        if self._armed:
+            return
+
+        if self._in_frame:
+            # 처리 중인 프레임의 콜백이 보낸 요청은 다음 프레임으로
+            elapsed = 0
+        else:
+            elapsed = (time.perf_counter() - self._last_frame
+                       if self._last_frame is not None else self.interval)
+        if elapsed >= self.interval:
+            self.flush()
+        else:
+            # 프레임 간격이 지날 때 마지막 요청을 처리
+            self._armed = True
+            self._timer.interval = max(1, int((self.interval - elapsed) * 1000))
+            self._timer.start()
+
+    def cancel(self, name):
+        """처리되지 않은 요청 버리기 (더 큰 갱신이 대신할 때)"""
+        if self.pending.pop(name, None) is not None:
+            self.dropped[name] += 1
+
+    def flush(self):
+        """대기 중인 요청을 지금 모두 처리"""
+        if self._armed:
+            self._timer.stop()
+            self._armed = False
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        self.frames += 1
+        self._in_frame = True
+        try:
+            for callback, args in pending.values():
+                callback(*args)
+        finally:
+            self._in_frame = False
+            self._last_frame = time.perf_counter()
+
+    def _on_timer(self):
+        self._armed = False
+        self.flush()
+
+    def stats(self):
+        """요청, 처리한 프레임, 합친/버린 요청 수 요약"""
+        return {
+            'frames': self.frames,
+            'requests': dict(self.requests),
+            'coalesced': dict(self.coalesced),
+            'dropped': dict(self.dropped),
+            'pending': list(self.pending),
+        }
+
+    def stop(self):
+        """타이머 정지 (대기 중인 요청은 버림)"""
+        self._timer.stop()
+        self._armed = False
+        for name in list(self.pending):
+            self.cancel(name)
@@ -0,0 +1,117 @@
+import numpy as np
+
+
+class GridIndex:
+    """점 위치에 대한 균일 격자 색인 (적중 판정, 반경/사각형 질의)
+
+    점 번호를 격자 칸 순서로 정렬해 두고 칸마다 시작 위치를 기록한다.
+    질의할 때는 범위에 걸친 칸의 점만 거리를 계산한다. 칸이 바뀐 점은 따로
+    모아 두었다가 많이 쌓이면 색인을 다시 만든다.
+    """
+
+    def __init__(self, bounds=(0.0, 6.0, 0.0, 6.0), cell_size=0.25, rebuild_threshold=256):
+        self.x0, x1, self.y0, y1 = bounds
+        self.cell_size = cell_size
+        self.nx = max(1, int(np.ceil((x1 - self.x0) / cell_size)))
+        self.ny = max(1, int(np.ceil((y1 - self.y0) / cell_size)))
+        self.rebuild_threshold = rebuild_threshold
+        self.positions = np.empty((0, 2))
+        self._cells = np.empty(0, dtype=np.intp)  # 색인을 만들 때 각 점의 칸
+        self._order = np.empty(0, dtype=np.intp)  # 칸 순서로 정렬한 점 번호
+        self._starts = np.zeros(self.nx * self.ny + 1, dtype=np.intp)
+        self._moved = set()  # 색인을 만든 뒤 칸이 바뀐 점
+        self._moved_mask = np.zeros(0, dtype=bool)
+        self._moved_array = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _column(self, x):
+        return min(max(int(np.floor((x - self.x0) / self.cell_size)), 0), self.nx - 1)
+
+    def _row(self, y):
+        return min(max(int(np.floor((y - self.y0) / self.cell_size)), 0), self.ny - 1)
+
+    def build(self, positions):
+        """위치 배열(n x 2)로 색인 만들기 (배열은 복사하지 않고 참조)"""
+        self.positions = positions
+        columns = np.clip(np.floor((positions[:, 0] - self.x0) / self.cell_size),
+                          0, self.nx - 1).astype(np.intp)
+        rows = np.clip(np.floor((positions[:, 1] - self.y0) / self.cell_size),
+                       0, self.ny - 1).astype(np.intp)
+        self._cells = columns * self.ny + rows
+        self._order = np.argsort(self._cells, kind='stable')
+        self._starts = np.searchsorted(self._cells[self._order],
+                                       np.arange(self.nx * self.ny + 1))
+        self._moved = set()
+        self._moved_mask = np.zeros(len(positions), dtype=bool)
+        self._moved_array = None
+
+    def move(self, index, x, y):
+        """점 하나의 이동 반영 (positions 배열은 호출한 쪽에서 이미 갱신)"""
+        moved = self._column(x) * self.ny + self._row(y) != self._cells[index]
+        if moved == self._moved_mask[index]:
+            return
+        if moved:
+            self._moved.add(index)
+        else:
+            self._moved.discard(index)
+        self._moved_mask[index] = moved
+        self._moved_array = None
+        if len(self._moved) > self.rebuild_threshold:
+            self.build(self.positions)
+
+    def _candidates(self, xmin, ymin, xmax, ymax, ordered=True):
+        """사각형 범위에 걸친 칸의 점 번호 (정확한 판정은 호출한 쪽에서)"""
+        row_min, row_max = self._row(ymin), self._row(ymax)
+        # 같은 열의 칸들은 정렬 순서에서 이어져 있으므로 열마다 한 구간씩
+        parts = [
+            self._order[self._starts[column * self.ny + row_min]:
+                        self._starts[column * self.ny + row_max + 1]]
+            for column in range(self._column(xmin), self._column(xmax) + 1)
+        ]
+        candidates = np.concatenate(parts)
+        if self._moved:
+            # 옮겨 간 점은 원래 칸에서 빼고 따로 모아 둔 목록으로 대신함
+            if self._moved_array is None:
+                self._moved_array = np.fromiter(self._moved, dtype=np.intp,
+                                                count=len(self._moved))
+            candidates = np.concatenate(
+                (candidates[~self._moved_mask[candidates]], self._moved_array))
+        return np.sort(candidates) if ordered else candidates
+
+    def query_rect(self, xmin, ymin, xmax, ymax):
+        """사각형 안의 점 번호 (오름차순)"""
+        if not len(self.positions):
+            return np.empty(0, dtype=np.intp)
+        xmin, xmax = min(xmin, xmax), max(xmin, xmax)
+        ymin, ymax = min(ymin, ymax), max(ymin, ymax)
+        candidates = self._candidates(xmin, ymin, xmax, ymax)
+        x = self.positions[candidates, 0]
+        y = self.positions[candidates, 1]
+        return candidates[(x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)]
+
+    def query_radius(self, x, y, radius):
+        """(x, y)에서 반경 안의 점 번호 (오름차순)"""
+        candidates, distances = self._within(x, y, radius)
+        return candidates
+
+    def nearest(self, x, y, max_distance):
+        """max_distance보다 가까운 점 중 가장 가까운 점 번호 (없으면 None)"""
+        candidates, distances = self._within(x, y, max_distance, ordered=False)
+        if not len(candidates):
+            return None
+        best = distances.min()
+        if best >= max_distance:
+            return None
+        return int(candidates[distances == best].min())  # 거리가 같으면 번호가 작은 점
+
+    def _within(self, x, y, radius, ordered=True):
+        """반경 안의 점 번호와 거리"""
+        if not len(self.positions):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        candidates = self._candidates(x - radius, y - radius, x + radius, y + radius, ordered)
+        distances = np.hypot(self.positions[candidates, 0] - x,
+                             self.positions[candidates, 1] - y)
+        inside = distances <= radius
+        return candidates[inside], distances[inside]
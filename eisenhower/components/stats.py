@@ -0,0 +1,36 @@
+from collections import deque
+
+import numpy as np
+
+
+# 한 프레임에 쓸 수 있는 시간 (60fps)
+FRAME_BUDGET = 1 / 60
+
+
+class FrameStats:
+    """프레임 시간 기록 (최근 프레임들의 통계와 예산 초과 횟수)"""
+
+    def __init__(self, budget=FRAME_BUDGET, size=240):
+        self.budget = budget
+        self.times = deque(maxlen=size)
+        self.frames = 0
+        self.over_budget = 0
+
+    def record(self, seconds):
+        """프레임 하나의 소요 시간 기록"""
+        self.times.append(seconds)
+        self.frames += 1
+        if seconds > self.budget:
+            self.over_budget += 1
+
+    def summary(self):
+        """최근 프레임 시간 요약 (밀리초)"""
+        times = np.array(self.times) * 1000
+        return {
+            'frames': self.frames,
+            'over_budget': self.over_budget,
+            'budget_ms': self.budget * 1000,
+            'mean_ms': float(times.mean()) if len(times) else 0.0,
+            'p95_ms': float(np.percentile(times, 95)) if len(times) else 0.0,
+            'max_ms': float(times.max()) if len(times) else 0.0,
+        }
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+import time
+import random
+
+from .components.stats import FrameStats
+
+
+class TaskController:
+    """작업 관리자와 렌더링 백엔드를 잇는 컨트롤러 (백엔드와 상관없는 인터랙션)
+
+    점 끌기, 드래그 중 파이 차트 미리보기, 총 시간 변경, 할 일 추가를 처리한다.
+    좌표는 매트릭스의 (긴급도, 중요도)이고, 그리기는 RenderBackend의 메서드로만
+    하므로 matplotlib 창(EisenhowerVisualizer)과 QGraphicsScene 창(SceneWindow)이
+    같은 로직을 쓴다. 화면의 이벤트를 이 좌표로 바꾸는 것은 각 창이 맡는다.
+    """
+
+    def __init__(self, task_manager, backend=None):
+        self.task_manager = task_manager
+        self.backend = None  # 파이 차트와 매트릭스를 그리는 렌더링 백엔드
+        self.pie_chart = None
+        self.matrix = None
+        self.selected_point = None
+        self.is_dragging = False
+        self.drag_latency = FrameStats()  # 점을 누른 뒤 첫 움직임이 그려질 때까지 걸린 시간
+        self._press_time = None
+        self._preview_cell = None  # 드래그 중 미리보기를 마지막으로 그린 격자 좌표
+        self.task_dialog = None  # 한 번 만들어 계속 재사용하는 할 일 입력 다이얼로그
+        if backend is not None:
+            self.set_backend(backend)
+
+    def set_backend(self, backend):
+        """렌더링 백엔드 연결"""
+        self.backend = backend
+        self.pie_chart = backend.pie_chart
+        self.matrix = backend.matrix
+
+    def update_plots(self, total_minutes=None):
+        """할당 시간을 다시 계산해 파이 차트와 매트릭스 갱신"""
+        if total_minutes is None:
+            total_minutes = self.task_manager.available_minutes
+        allocation = self.task_manager.recalculate_time(total_minutes)
+        self.backend.update(
+            self.task_manager.tasks,
+            allocation,
+            self.task_manager.available_hours,
+            self.task_manager.available_minutes_part
+        )
+
+    def request_total_minutes(self, minutes):
+        """총 시간 변경 요청 (프레임마다 마지막 값으로 한 번만 적용)"""
+        self.backend.schedule('total', self._set_total_minutes, minutes)
+
+    def _set_total_minutes(self, minutes):
+        """총 시간 적용 (컨트롤 표시를 맞추고 다시 그림)"""
+        self._sync_controls(minutes)
+        self.update_plots(minutes)
+
+    def _sync_controls(self, minutes):
+        """총 시간 컨트롤 표시 맞추기 (창마다 다름)"""
+
+    def press(self, urgency, importance):
+        """(긴급도, 중요도) 위치에서 가장 가까운 점을 끌기 시작"""
+        point = self.matrix.get_point_at_position(urgency, importance)
+        if point is None:
+            return
+        self._press_time = time.perf_counter()
+        self._preview_cell = (point.task.urgency, point.task.importance)
+        self.selected_point = point
+        self.is_dragging = True
+
+        # 선택된 점을 점 모음에서 숨기고 드래그용 점으로 대신 그림 (저품질 모드)
+        self.backend.begin_drag(point)
+
+    def drag_to(self, urgency, importance):
+        """끌고 있는 점을 옮김 (그리기는 프레임마다 한 번만)"""
+        if not self.is_dragging or self.selected_point is None:
+            return
+
+        # 범위 제한 (0.5 ~ 5.5)
+        urgency = min(max(urgency, 0.5), 5.5)
+        importance = min(max(importance, 0.5), 5.5)
+        self.selected_point.update_position(urgency, importance)
+        self.backend.schedule('drag', self._render_drag)
+
+    def _render_drag(self):
+        """드래그 중인 점의 현재 위치 그리기"""
+        if self.selected_point is None:
+            return
+
+        # 드래그용 점과 라벨만 다시 그리고 바뀐 범위만 업데이트
+        self.backend.render_drag()
+
+        # 놓았을 때의 격자 좌표가 바뀌면 파이 차트만 미리보기로 다시 그림
+        # (끄는 점은 이번 프레임에 바로 보이도록 미리보기는 다음 프레임에)
+        urgency, importance = self.selected_point.dragged_pos
+        cell = (min(max(round(urgency), 1), 5), min(max(round(importance), 1), 5))
+        if cell != self._preview_cell:
+            self._preview_cell = cell
+            self.backend.schedule('preview', self.preview_allocation, *cell)
+
+        if self._press_time is not None:
+            self.drag_latency.record(time.perf_counter() - self._press_time)
+            self._press_time = None
+
+    def release(self):
+        """끌던 점을 가장 가까운 격자 좌표에 놓고 저장"""
+        point, self.selected_point = self.selected_point, None
+        self.is_dragging = False
+        if point is None:
+            return
+
+        # 가장 가까운 그리드 좌표 (1 ~ 5)
+        urgency = min(max(round(point.dragged_pos[0]), 1), 5)
+        importance = min(max(round(point.dragged_pos[1]), 1), 5)
+
+        # 아직 그리지 않은 드래그 프레임과 미리보기는 아래 전체 갱신이 대신함
+        self.backend.cancel('drag')
+        self.backend.cancel('preview')
+        self.backend.end_drag()
+        self._press_time = None
+        self._preview_cell = None
+
+        point.update_position(urgency, importance)
+        self.task_manager.update_task_position(point.task_id, urgency, importance)
+        self.update_plots()
+
+    def preview_allocation(self, urgency, importance):
+        """드래그 중인 작업을 (긴급도, 중요도)로 옮겼을 때의 파이 차트 미리보기
+
+        저장이나 매트릭스 갱신 없이 할당 시간만 다시 계산해 파이 차트만 다시 그린다.
+        """
+        if self.selected_point is None:
+            return
+        allocation = self.task_manager.preview_allocation(
+            self.selected_point.task_id, urgency, importance)
+        self.backend.preview(allocation,
+                             self.task_manager.available_hours,
+                             self.task_manager.available_minutes_part)
+
+    def reset(self, event=None):
+        """모든 작업 지우기"""
+        self.task_manager.clear_tasks()
+        self.update_plots()
+
+    def preload_task_dialog(self, parent=None):
+        """할 일 입력 다이얼로그를 미리 만들어 둠 (폰트 등록과 스타일시트 해석은 한 번만)"""
+        if self.task_dialog is None:
+            # PyQt5 다이얼로그 모듈은 첫 그림에 필요 없으므로 여기서 불러옴
+            from .ui.task_input_dialog import TaskInputDialog
+            self.task_dialog = TaskInputDialog(parent)
+        return self.task_dialog
+
+    def add_task(self, event=None):
+        # 할 일 입력 다이얼로그 표시
+        from .ui.task_input_dialog import QDialog
+
+        dialog = self.preload_task_dialog()
+        dialog.reset()
+        if dialog.exec_() == QDialog.Accepted:
+            task_name = dialog.input_field.text().strip()
+            if task_name:
+                # 랜덤 위치 생성 (1-5 사이)
+                urgency = random.randint(1, 5)
+                importance = random.randint(1, 5)
+
+                # 새로운 작업 추가
+                self.task_manager.add_task(task_name, urgency, importance)
+                self.update_plots()
+
+    def close(self):
+        """남은 프레임과 타이머를 정리하고 예약된 저장을 마침"""
+        self.backend.stop()
+        self.task_manager.flush()
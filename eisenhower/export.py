@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+"""
+작업 파일 일괄 내보내기 (화면 없이)
+
+여러 작업 파일(또는 폴더 안의 모든 *.json)의 파이 차트와 매트릭스를 Agg 백엔드로
+그려 PNG/SVG/PDF로 저장한다. 작업 프로세스마다 그림을 한 번만 만들고 파일마다
+동적 아티스트만 다시 그리므로 축, 사분면 배경 같은 정적인 부분은 재사용된다.
+결과는 파일마다 끝나는 대로 디스크에 쓰고, 마지막에 초당 파일 수를 보고한다.
+작업 파일은 읽기 전용으로 열어 고치지 않는다.
+
+    python -m eisenhower.export team/ -o snapshots --format png pdf --workers 4
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+EXPORT_FORMATS = ('png', 'svg', 'pdf')
+
+# 작업 프로세스마다 한 번 만드는 렌더링 백엔드
+_backend = None
+
+
+def collect_task_files(paths):
+    """작업 파일 목록과 출력 이름 (입력들의 공통 폴더 기준 상대 경로, 확장자 제외)
+
+    폴더는 하위 폴더까지 *.json 파일을 찾는다 (숨김 파일과 임시 파일은 제외).
+    """
+    files, roots = [], []
+    for path in paths:
+        if os.path.isdir(path):
+            roots.append(path)
+            for directory, subdirectories, names in os.walk(path):
+                subdirectories[:] = sorted(name for name in subdirectories
+                                           if not name.startswith('.'))
+                files += [os.path.join(directory, name) for name in sorted(names)
+                          if name.endswith('.json') and not name.startswith('.')]
+        elif os.path.isfile(path):
+            roots.append(os.path.dirname(path))
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"작업 파일이나 폴더가 없음: {path}")
+
+    if not files:
+        return []
+    root = os.path.commonpath([os.path.abspath(root) for root in roots])
+    return [(path, os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0])
+            for path in files]
+
+
+def _init_worker(figsize, dpi, font_size):
+    """작업 프로세스 초기화: Agg 그림과 렌더링 백엔드를 한 번만 만듦"""
+    global _backend
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from . import font_cache
+    from .components.backend import MatplotlibBackend
+
+    font_cache.setup_matplotlib(font_size)
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+    _backend = MatplotlibBackend(fig, font_size)
+    fig.subplots_adjust(left=0.05, right=0.95, top=0.9, bottom=0.1, wspace=0.2)
+
+
+def export_file(tasks_path, output_base, formats=('png',)):
+    """작업 파일 하나를 그려 형식별로 저장하고 저장한 파일 경로 목록 반환"""
+    from .task_manager import TaskManager
+
+    task_manager = TaskManager(tasks_path, read_only=True)
+    try:
+        allocation = task_manager.recalculate_time(task_manager.available_minutes)
+        _backend.update(task_manager.tasks, allocation,
+                        task_manager.available_hours, task_manager.available_minutes_part)
+    finally:
+        task_manager.close()
+
+    os.makedirs(os.path.dirname(output_base) or '.', exist_ok=True)
+    written = []
+    for format in formats:
+        path = f"{output_base}.{format}"
+        _backend.save(path, format)
+        written.append(path)
+    return written
+
+
+def export_all(paths, output_dir, formats=('png',), workers=None,
+               figsize=(17, 8), dpi=100, font_size=12):
+    """작업 파일들을 프로세스 풀에서 내보내고 (성공 수, 실패 수, 걸린 시간) 반환"""
+    jobs = collect_task_files(paths)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    succeeded = failed = 0
+    start = time.perf_counter()
+
+    def report(tasks_path, future):
+        nonlocal succeeded, failed
+        try:
+            written = future()
+        except Exception as error:
+            failed += 1
+            print(f"실패: {tasks_path}: {error}", file=sys.stderr)
+        else:
+            succeeded += 1
+            print(f"[{succeeded + failed}/{len(jobs)}] {tasks_path} -> {', '.join(written)}",
+                  flush=True)
+
+    if workers == 1:
+        # 프로세스 하나면 풀 없이 현재 프로세스에서 그림
+        _init_worker(figsize, dpi, font_size)
+        for tasks_path, name in jobs:
+            report(tasks_path, lambda: export_file(
+                tasks_path, os.path.join(output_dir, name), formats))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(figsize, dpi, font_size)) as executor:
+            futures = {executor.submit(export_file, tasks_path,
+                                       os.path.join(output_dir, name), formats): tasks_path
+                       for tasks_path, name in jobs}
+            # 끝난 순서대로 보고 (파일은 작업 프로세스가 이미 디스크에 씀)
+            for future in as_completed(futures):
+                report(futures[future], future.result)
+
+    return succeeded, failed, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="작업 파일 일괄 내보내기 (화면 없이)")
+    parser.add_argument('paths', nargs='+', help="작업 파일(.json) 또는 폴더 (여러 개)")
+    parser.add_argument('-o', '--output', default='exports', help="출력 폴더")
+    parser.add_argument('--format', nargs='+', choices=EXPORT_FORMATS, default=['png'],
+                        help="출력 형식 (여러 개)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    try:
+        succeeded, failed, seconds = export_all(
+            args.paths, args.output, args.format, args.workers, dpi=args.dpi)
+    except FileNotFoundError as error:
+        print(error, file=sys.stderr)
+        return 2
+    rate = succeeded / seconds if seconds > 0 else 0.0
+    print(f"작업 파일 {succeeded}개 내보냄 (실패 {failed}개), "
+          f"{seconds:.2f}초, 초당 {rate:.1f}개")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
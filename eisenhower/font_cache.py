@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+번들된 Maplestory 글꼴 등록 (프로세스마다 한 번)
+
+글꼴 파일은 실행 위치와 상관없이 패키지 안의 fonts 폴더에서 찾는다. matplotlib과
+Qt에는 처음 필요할 때 한 번만 등록하고, 크기별 FontProperties/QFont도 재사용한다.
+"""
+
+import os
+import platform
+from functools import lru_cache
+
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+FONT_WEIGHTS = ('Light', 'Bold')
+
+
+def font_path(weight='Light'):
+    """글꼴 파일 경로 (Windows는 .ttf, 그 외는 .otf)"""
+    extension = ".ttf" if platform.system() == "Windows" else ".otf"
+    return os.path.join(FONT_DIR, f"Maplestory {weight}{extension}")
+
+
+@lru_cache(maxsize=None)
+def matplotlib_font_family():
+    """matplotlib 글꼴 목록에 번들 글꼴을 등록하고 글꼴 이름 반환"""
+    import matplotlib.font_manager as fm
+
+    for weight in FONT_WEIGHTS:
+        fm.fontManager.addfont(font_path(weight))
+    return fm.FontProperties(fname=font_path()).get_name()
+
+
+def setup_matplotlib(font_size):
+    """matplotlib 기본 글꼴을 번들 글꼴로 설정"""
+    import matplotlib
+
+    matplotlib.rcParams['font.family'] = matplotlib_font_family()
+    matplotlib.rcParams['font.size'] = font_size
+    matplotlib.rcParams['axes.unicode_minus'] = False
+
+
+@lru_cache(maxsize=64)
+def font_properties(size):
+    """크기별 FontProperties (같은 크기면 같은 객체, 바꾸지 말고 읽기만)"""
+    from matplotlib.font_manager import FontProperties
+
+    return FontProperties(family=matplotlib_font_family(), size=size)
+
+
+@lru_cache(maxsize=None)
+def qt_font_family():
+    """Qt 글꼴 데이터베이스에 번들 글꼴을 등록하고 글꼴 이름 반환 (실패하면 None)
+
+    QApplication이 만들어진 뒤에 호출해야 한다.
+    """
+    from PyQt5.QtGui import QFontDatabase
+
+    family = None
+    for weight in FONT_WEIGHTS:
+        font_id = QFontDatabase.addApplicationFont(font_path(weight))
+        if font_id >= 0 and family is None:
+            family = QFontDatabase.applicationFontFamilies(font_id)[0]
+    return family
+
+
+@lru_cache(maxsize=64)
+def qt_font(pixel_size):
+    """px 크기별 QFont (번들 글꼴, 등록에 실패하면 기본 글꼴)"""
+    from PyQt5.QtGui import QFont
+
+    font = QFont()
+    family = qt_font_family()
+    if family is not None:
+        font.setFamily(family)
+    font.setPixelSize(pixel_size)
+    return font
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QApplication, QMainWindow
+
+
+class EisenhowerWindow(QMainWindow):
+    """matplotlib 캔버스를 담는 Qt 메인 창
+
+    pyplot 없이 Figure를 직접 만들어 캔버스에 붙이므로 그리기가 Qt 이벤트
+    루프 안에서 이루어진다. 캔버스 타이머(프레임 스케줄러, 파이 차트 타이머)는
+    QTimer로 동작한다. 할 일 입력 다이얼로그는 첫 화면을 그린 직후 한 번만 만들어 둔다.
+    """
+
+    def __init__(self, visualizer, figsize=(17, 10)):
+        super().__init__()
+        self.visualizer = visualizer
+        self.setWindowTitle("아이젠하워 매트릭스")
+
+        # 그림과 캔버스
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.canvas.setFocusPolicy(Qt.StrongFocus)  # 시간 입력 필드의 키 입력
+        self.setCentralWidget(self.canvas)
+
+        visualizer.setup_initial_plot(self.figure)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.canvas.setFocus()
+        # 첫 화면을 그린 뒤 이벤트 루프가 한가할 때 다이얼로그를 미리 만듦
+        QTimer.singleShot(0, lambda: self.visualizer.preload_task_dialog(self))
+
+    def closeEvent(self, event):
+        # 남은 프레임과 타이머를 정리하고 예약된 저장을 마침
+        self.visualizer.close()
+        super().closeEvent(event)
+
+
+def run_window(visualizer):
+    """Qt 창을 띄우고 이벤트 루프 실행"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = EisenhowerWindow(visualizer)
+    window.show()
+    return app.exec_()
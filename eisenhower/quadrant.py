@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+# 사분면 이름 (Matrix.quadrant_colors의 키와 같은 순서)
+QUADRANTS = ('urgent_important', 'important', 'urgent', 'neither')
+
+
+def quadrant_of(urgency, importance):
+    """긴급도/중요도로 사분면 번호(QUADRANTS의 인덱스) 계산
+
+    매트릭스의 가운데 선(3)보다 큰 값만 긴급/중요로 본다.
+    """
+    urgent = urgency > 3
+    important = importance > 3
+    if urgent and important:
+        return 0
+    if important:
+        return 1
+    if urgent:
+        return 2
+    return 3
+
+
+def quadrants_of(urgency, importance):
+    """quadrant_of의 배열 버전 (NumPy 배열을 받아 사분면 번호 배열 반환)"""
+    return 3 - 2 * (importance > 3) - (urgency > 3)
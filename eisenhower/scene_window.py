@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import (QApplication, QGraphicsView, QHBoxLayout, QLabel, QMainWindow,
+                             QPushButton, QSlider, QVBoxLayout, QWidget)
+
+from .components.scene import SceneBackend, create_scene
+from .controller import TaskController
+from .task_manager import MIN_TOTAL_MINUTES, MAX_TOTAL_MINUTES, TOTAL_MINUTES_STEP
+
+
+class SceneView(QGraphicsView):
+    """장면 보기: 마우스 이벤트를 장면 좌표로 바꿔 창에 전달"""
+
+    def __init__(self, scene, owner):
+        super().__init__(scene)
+        self.owner = owner  # 이벤트를 처리하는 창 (QWidget.window()와 구분)
+        self.setRenderHint(QPainter.Antialiasing)
+        # 바뀐 항목의 영역만 다시 그림
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+
+    def mousePressEvent(self, event):
+        position = self.mapToScene(event.pos())
+        self.owner.on_press(position.x(), position.y())
+
+    def mouseMoveEvent(self, event):
+        position = self.mapToScene(event.pos())
+        self.owner.on_motion(position.x(), position.y())
+
+    def mouseReleaseEvent(self, event):
+        self.owner.on_release()
+
+
+class SceneWindow(QMainWindow):
+    """QGraphicsScene 백엔드로 그리는 메인 창
+
+    인터랙션은 matplotlib 창과 같은 TaskController가 처리하고, 이 창은 장면 좌표를
+    (긴급도, 중요도)로 바꿔 전달하고 Qt 위젯으로 총 시간 슬라이더와 할 일 추가
+    버튼을 보여 준다. 할 일 입력 다이얼로그는 첫 화면을 그린 직후 한 번만 만든다.
+    """
+
+    def __init__(self, task_manager, base_font_size=12):
+        super().__init__()
+        self.setWindowTitle("아이젠하워 매트릭스")
+
+        self.scene = create_scene()
+        self.backend = SceneBackend(self.scene, base_font_size)
+        self.controller = TaskController(task_manager, self.backend)
+        self.view = SceneView(self.scene, self)
+
+        # 총 시간 슬라이더
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(MIN_TOTAL_MINUTES // TOTAL_MINUTES_STEP,
+                             MAX_TOTAL_MINUTES // TOTAL_MINUTES_STEP)
+        self.slider.setValue(task_manager.available_minutes // TOTAL_MINUTES_STEP)
+        self.slider.valueChanged.connect(self.on_slider_changed)
+        self.total_label = QLabel(str(task_manager.available_minutes))
+        add_button = QPushButton("할 일 추가")
+        add_button.clicked.connect(lambda: self.controller.add_task())
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("총 시간 (분)"))
+        controls.addWidget(self.slider)
+        controls.addWidget(self.total_label)
+        controls.addWidget(add_button)
+        central = QWidget()
+        layout = QVBoxLayout(central)
+        layout.addWidget(self.view)
+        layout.addLayout(controls)
+        self.setCentralWidget(central)
+
+        self.controller.update_plots()
+
+    def on_slider_changed(self, value):
+        # 슬라이더 값 변경 시 호출 (그리기는 Qt가 다음 프레임에 한 번에)
+        minutes = value * TOTAL_MINUTES_STEP
+        self.total_label.setText(str(minutes))
+        self.controller.request_total_minutes(minutes)
+
+    def on_press(self, x, y):
+        pie_chart, matrix = self.backend.pie_chart, self.backend.matrix
+        if pie_chart.contains(x, y):
+            pie_chart.on_click(x, y)
+        elif matrix.contains(x, y):
+            self.controller.press(*matrix.from_scene(x, y))
+
+    def on_motion(self, x, y):
+        self.controller.drag_to(*self.backend.matrix.from_scene(x, y))
+
+    def on_release(self):
+        self.controller.release()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # 첫 화면을 그린 뒤 이벤트 루프가 한가할 때 다이얼로그를 미리 만듦
+        QTimer.singleShot(0, lambda: self.controller.preload_task_dialog(self))
+
+    def closeEvent(self, event):
+        self.controller.close()
+        super().closeEvent(event)
+
+
+def run_scene_window(task_manager):
+    """QGraphicsScene 백엔드 창을 띄우고 이벤트 루프 실행"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = SceneWindow(task_manager)
+    window.show()
+    return app.exec_()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+시작 시간 프로파일
+
+새 파이썬 프로세스(-X importtime)에서 작업 파일을 불러와 창을 띄우고, 첫 화면이
+그려질 때까지의 단계별 시간과 패키지별 import 시간을 보고한다. 첫 화면까지의
+시간이 예산을 넘으면 0이 아닌 종료 코드를 돌려주므로 CI나 cron에서 회귀 검사로
+쓸 수 있다.
+
+    python run_eisenhower.py --profile-startup --budget 3
+    python -m eisenhower.startup --backend scene
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from collections import Counter
+
+
+# 첫 화면까지의 기본 예산 (초)
+STARTUP_BUDGET = 3.0
+
+
+def _first_frame(backend, tasks_path):
+    """자식 프로세스: 창을 띄우고 첫 화면이 그려질 때까지의 단계별 시간 출력"""
+    stages = []
+    last = time.perf_counter()
+
+    def mark(name):
+        nonlocal last
+        now = time.perf_counter()
+        stages.append((name, now - last))
+        last = now
+
+    from PyQt5.QtCore import QEvent, QObject
+    from PyQt5.QtWidgets import QApplication
+    from .task_manager import TaskManager
+    if backend == 'scene':
+        from .scene_window import SceneWindow
+    else:
+        from .main_window import EisenhowerWindow
+        from .visualizer import EisenhowerVisualizer
+    mark('import')
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    task_manager = TaskManager(tasks_path)
+    task_manager.tasks  # 지연 로드하는 저장소도 여기서 읽음
+    mark('load')
+
+    if backend == 'scene':
+        window = SceneWindow(task_manager)
+        surface = window.view.viewport()
+    else:
+        window = EisenhowerWindow(EisenhowerVisualizer(task_manager))
+        surface = window.canvas
+    mark('window')
+
+    # 첫 그리기 이벤트가 처리될 때까지 이벤트 루프 실행
+    class PaintWatcher(QObject):
+        painted = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                PaintWatcher.painted = True
+            return False
+
+    watcher = PaintWatcher()
+    surface.installEventFilter(watcher)
+    window.show()
+    deadline = time.perf_counter() + 60
+    while not PaintWatcher.painted and time.perf_counter() < deadline:
+        app.processEvents()
+    # 처리 중이던 그리기가 끝난 시점
+    app.processEvents()
+    mark('first_frame')
+
+    print(json.dumps({'stages': stages, 'first_frame_at': time.time(),
+                      'painted': PaintWatcher.painted}), flush=True)
+    window.close()
+    task_manager.close()
+
+
+def _import_times(stderr):
+    """-X importtime 출력에서 최상위 패키지별 자체 import 시간 합 (초)"""
+    totals = Counter()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        totals[name.strip().split('.')[0]] += int(self_us) / 1e6
+    return totals
+
+
+def profile_startup(backend='matplotlib', budget=STARTUP_BUDGET, tasks_path=None, top=10):
+    """첫 화면까지의 시간을 재고 보고 (예산 안이면 0, 넘으면 1, 실패하면 2 반환)"""
+    if tasks_path is None:
+        tasks_path = os.path.join(os.path.dirname(__file__), 'tasks.json')
+
+    with tempfile.TemporaryDirectory() as directory:
+        # 실제 작업 파일(과 저널)은 건드리지 않도록 복사본으로 실행
+        copy_path = os.path.join(directory, os.path.basename(tasks_path))
+        for source in (tasks_path, os.path.splitext(tasks_path)[0] + '.journal'):
+            if os.path.exists(source):
+                shutil.copy(source, os.path.join(directory, os.path.basename(source)))
+
+        env = dict(os.environ)
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        command = [sys.executable, '-X', 'importtime', '-m', 'eisenhower.startup',
+                   '--child', '--backend', backend, '--tasks', copy_path]
+        started_at = time.time()
+        result = subprocess.run(command, capture_output=True, text=True, env=env,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    report = None
+    for line in result.stdout.splitlines():
+        if line.startswith('{'):
+            report = json.loads(line)
+    if result.returncode != 0 or report is None or not report['painted']:
+        print("시작 시간 측정 실패")
+        print('\n'.join(line for line in result.stderr.splitlines()
+                        if not line.startswith('import time:')))
+        return 2
+
+    first_frame = report['first_frame_at'] - started_at
+    print(f"시작 시간 프로파일 ({backend} 백엔드)")
+    print("  단계별 시간")
+    for name, seconds in report['stages']:
+        print(f"    {name:<14}{seconds * 1000:>10.1f} ms")
+    print("  패키지별 import 시간 (자체 시간 합)")
+    for name, seconds in _import_times(result.stderr).most_common(top):
+        print(f"    {name:<14}{seconds * 1000:>10.1f} ms")
+    within = first_frame <= budget
+    print(f"  첫 화면까지    {first_frame * 1000:>10.1f} ms "
+          f"(예산 {budget * 1000:.0f} ms, {'통과' if within else '초과'})")
+    return 0 if within else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 프로파일")
+    parser.add_argument('--backend', choices=['matplotlib', 'scene'], default='matplotlib')
+    parser.add_argument('--budget', type=float, default=STARTUP_BUDGET,
+                        help="첫 화면까지의 예산 (초)")
+    parser.add_argument('--tasks', default=None, help="작업 파일 (기본: 패키지의 tasks.json)")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _first_frame(args.backend, args.tasks)
+        return 0
+    return profile_startup(args.backend, args.budget, args.tasks)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+from .journal import TaskJournal, atomic_write_json, read_snapshot
+from .scheduler import SaveScheduler
+from .sqlite_store import SqliteTaskStore
+
+__all__ = ['TaskJournal', 'SqliteTaskStore', 'SaveScheduler',
+           'atomic_write_json', 'read_snapshot']
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import tempfile
+import threading
+
+
+def atomic_write_json(path, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔 JSON 파일을 원자적으로 저장"""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', suffix='.json', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_snapshot(path, strict=False):
+    """스냅샷 파일 읽기 (작업 리스트만 있는 이전 형식도 허용)
+
+    파일이 없거나 깨졌으면 빈 목록으로 시작한다. strict=True면 대신 예외를 낸다.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        if strict:
+            raise
+        return {'tasks': []}
+    if isinstance(data, list):
+        return {'tasks': data}
+    if not isinstance(data, dict) or not isinstance(data.get('tasks', []), list):
+        if strict:
+            raise ValueError(f"작업 파일 형식이 아님: {path}")
+        return {'tasks': []}
+    data.setdefault('tasks', [])
+    return data
+
+
+def replay(data, records, seq=0):
+    """seq 이후의 저널 레코드를 스냅샷 데이터에 순서대로 반영하고 마지막 순번 반환
+
+    작업은 id로 찾는다 (이름이 같은 작업이 여러 개여도 정확히 한 작업만 바뀜).
+    """
+    # id -> 작업 (dict는 삽입 순서를 유지하므로 목록 순서가 보존됨).
+    # 저널이 생기기 전의 스냅샷에는 id가 없을 수 있음 (불러온 뒤 id를 받아 다시 저장됨)
+    tasks = {task.get('id') or id(task): task for task in data['tasks']}
+
+    for record in records:
+        if record['seq'] <= seq:
+            continue  # 이미 스냅샷에 반영된 레코드
+        seq = record['seq']
+        op = record.get('op')
+        if op == 'add':
+            task = dict(record['task'])
+            tasks[task['id']] = task
+        elif op == 'remove':
+            tasks.pop(record['id'], None)
+        elif op == 'update':
+            task = tasks.get(record['id'])
+            if task is not None:
+                task['긴급도'] = record['긴급도']
+                task['중요도'] = record['중요도']
+        elif op == 'total':
+            data['total_minutes'] = record['total_minutes']
+        elif op == 'clear':
+            tasks.clear()
+
+    data['tasks'] = list(tasks.values())
+    return seq
+
+
+def _read_records(path):
+    """저널 파일의 레코드 읽기
+
+    쓰다가 끊긴 마지막 줄은 무시한다. 중간의 깨진 줄은 건너뛰고 그 뒤의 레코드는 읽는다.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return []
+
+    records = []
+    for number, line in enumerate(lines, 1):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            if number < len(lines):
+                print(f"저널의 깨진 줄 건너뜀: {path}:{number}")
+    return records
+
+
+def _repair_tail(path):
+    """끊긴 마지막 줄을 잘라내고 파일이 줄바꿈으로 끝나게 함
+
+    다음 append가 끊긴 조각 뒤에 이어 붙어 새 레코드까지 깨지는 것을 막는다.
+    """
+    try:
+        with open(path, 'rb+') as f:
+            content = f.read()
+            end = content.rfind(b'\n') + 1
+            tail = content[end:]
+            if not tail:
+                return
+            try:
+                json.loads(tail)
+            except ValueError:
+                f.truncate(end)  # 끊긴 레코드는 버림
+            else:
+                f.write(b'\n')  # 줄바꿈만 빠진 온전한 레코드
+    except FileNotFoundError:
+        pass
+
+
+class TaskJournal:
+    """스냅샷(tasks.json)과 추가 전용 저널 파일로 작업 목록을 저장
+
+    변경 사항은 저널 끝에 한 줄씩 추가되고, 저널이 일정 길이를 넘으면
+    백그라운드 스레드가 저널을 스냅샷에 합친다(compaction). 각 레코드에는
+    순번(seq)이 붙고 스냅샷은 마지막으로 반영한 순번(journal_seq)을 기억하므로
+    합치는 도중 종료되어도 같은 레코드가 두 번 적용되지 않는다.
+    """
+
+    def __init__(self, path, compact_threshold=1000):
+        self.path = path
+        self.journal_path = os.path.splitext(path)[0] + '.journal'
+        self.rotated_path = self.journal_path + '.old'
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._journal_records = 0
+        self._compactor = None
+
+    def load(self, compact=True, strict=False):
+        """스냅샷을 읽고 남아 있는 저널을 순서대로 재생
+
+        compact=False면 파일을 전혀 바꾸지 않는다 (끊긴 줄 정리와 합치기 모두 생략).
+        strict=True면 스냅샷이 없거나 깨졌을 때 빈 목록 대신 예외를 낸다.
+        """
+        if compact:
+            _repair_tail(self.journal_path)
+        data = read_snapshot(self.path, strict)
+        seq = data.pop('journal_seq', 0)
+
+        active = _read_records(self.journal_path)
+        seq = replay(data, _read_records(self.rotated_path) + active, seq)
+        active_records = len(active)
+
+        with self._lock:
+            self._seq = seq
+            self._journal_records = active_records
+
+        # 이전 실행에서 합치지 못한 저널 정리
+        if compact and (os.path.exists(self.rotated_path)
+                        or active_records >= self.compact_threshold):
+            self.compact()
+        return data
+
+    def append(self, *records):
+        """레코드를 저널 끝에 추가 (작업 수와 무관한 비용)"""
+        if not records:
+            return
+        with self._lock:
+            lines = []
+            for record in records:
+                self._seq += 1
+                lines.append(json.dumps(
+                    dict(record, seq=self._seq), ensure_ascii=False))
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            self._journal_records += len(lines)
+            needs_compaction = self._journal_records >= self.compact_threshold
+
+        if needs_compaction:
+            self.compact()
+
+    def write_snapshot(self, data):
+        """전체 데이터를 스냅샷으로 저장하고 기존 저널을 비움"""
+        with self._lock:
+            self.wait_for_compaction()
+            atomic_write_json(self.path, dict(data, journal_seq=self._seq))
+            for path in (self.rotated_path, self.journal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._journal_records = 0
+
+    def compact(self, wait=False):
+        """저널을 백그라운드 스레드에서 스냅샷에 합침"""
+        with self._lock:
+            thread = self._compactor
+            if thread is None or not thread.is_alive():
+                # 새 레코드는 새 저널 파일에 쓰이도록 현재 저널을 교체
+                if not os.path.exists(self.rotated_path) and os.path.exists(self.journal_path):
+                    os.replace(self.journal_path, self.rotated_path)
+                    self._journal_records = 0
+                thread = threading.Thread(
+                    target=self._fold_rotated, name='TaskJournalCompactor', daemon=True)
+                self._compactor = thread
+                thread.start()
+
+        if wait:
+            thread.join()
+
+    def wait_for_compaction(self):
+        """진행 중인 합치기 작업이 끝날 때까지 대기"""
+        thread = self._compactor
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def close(self):
+        """진행 중인 합치기 작업 마무리"""
+        self.wait_for_compaction()
+
+    def _fold_rotated(self):
+        """교체된 저널을 스냅샷에 반영하고 삭제"""
+        if not os.path.exists(self.rotated_path):
+            return
+
+        data = read_snapshot(self.path)
+        seq = replay(data, _read_records(self.rotated_path),
+                     data.pop('journal_seq', 0))
+
+        atomic_write_json(self.path, dict(data, journal_seq=seq))
+        os.remove(self.rotated_path)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import threading
+import time
+
+
+# 저장에 실패했을 때 다시 시도하기까지의 대기 시간 (실패할 때마다 두 배, 최대값까지)
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+class SaveScheduler:
+    """연속된 변경 요청을 모아 조용한 구간이 지나면 작업 스레드에서 한 번만 저장
+
+    schedule()은 즉시 반환되므로 UI 이벤트 핸들러가 디스크 속도에 묶이지 않는다.
+    flush()는 대기 중인 저장을 호출한 스레드에서 바로 수행하고 끝날 때까지 기다린다.
+    """
+
+    def __init__(self, write, delay=0.5):
+        self._write = write
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._dirty = False
+        self._writing = False
+        self._closed = False
+        self._deadline = 0.0
+        self._retry_at = 0.0  # 연속 실패 중에는 이 시각 전에는 다시 쓰지 않음
+        self._failures = 0
+        self._thread = None
+        atexit.register(self.close)
+
+    def schedule(self):
+        """저장 예약 (마지막 요청 후 delay초 동안 변경이 없으면 저장)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._dirty = True
+            self._deadline = max(time.monotonic() + self.delay, self._retry_at)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='TaskSaveWorker', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self):
+        """대기 중인 저장을 즉시 수행하고 완료될 때까지 대기"""
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._writing = True
+        self._do_write()
+
+    def close(self):
+        """남은 변경 사항을 저장하고 작업 스레드 종료"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self.flush()
+        if self._thread is not None:
+            self._thread.join()
+        atexit.unregister(self.close)
+
+    @property
+    def pending(self):
+        """아직 저장되지 않은 변경이 있는지 여부"""
+        with self._cond:
+            return self._dirty or self._writing
+
+    def _run(self):
+        """작업 스레드: 조용한 구간이 지나면 저장"""
+        while True:
+            with self._cond:
+                while (not self._dirty or self._writing) and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return  # 남은 저장은 close()의 flush가 처리
+                # 새 요청이 들어오면 마감 시간이 뒤로 밀림
+                remaining = self._deadline - time.monotonic()
+                while remaining > 0 and not self._closed:
+                    self._cond.wait(remaining)
+                    remaining = self._deadline - time.monotonic()
+                if self._closed or not self._dirty or self._writing:
+                    continue
+                self._dirty = False
+                self._writing = True
+            try:
+                self._do_write()
+            except Exception as e:
+                # 작업 스레드는 살려 두고, 점점 길게 기다렸다가 다시 시도 (flush는 바로 시도)
+                with self._cond:
+                    self._failures += 1
+                    retry_delay = min(RETRY_DELAY * 2 ** (self._failures - 1), MAX_RETRY_DELAY)
+                    self._retry_at = time.monotonic() + retry_delay
+                    self._deadline = self._retry_at
+                    self._dirty = True
+                print(f"작업 저장 실패 ({retry_delay:.0f}초 뒤 다시 시도): {e}")
+
+    def _do_write(self):
+        try:
+            self._write()
+            with self._cond:
+                self._failures = 0
+                self._retry_at = 0.0
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
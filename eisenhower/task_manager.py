@@ -1,154 +1,350 @@
 # -*- coding: utf-8 -*-
 
-import pandas as pd
-import json
 import os
 import random
 import colorsys
+import threading
 
+from .quadrant import QUADRANTS
+from .storage import (SaveScheduler, SqliteTaskStore, TaskJournal,
+                      atomic_write_json, read_snapshot)
+from .task_store import Task, TaskStore
 
-class Task:
-    def __init__(self, name, urgency=3, importance=3):
-        self.name = name
+
+# 총 시간 슬라이더 범위 (분)
+MIN_TOTAL_MINUTES = 30
+MAX_TOTAL_MINUTES = 600
+TOTAL_MINUTES_STEP = 5
+
+# 파스텔톤 색상 팔레트
+PASTEL_COLORS = [
+    '#FFB3BA',  # 연한 빨강
+    '#BAFFC9',  # 연한 초록
+    '#BAE1FF',  # 연한 파랑
+    '#FFFFBA',  # 연한 노랑
+    '#FFB3F7',  # 연한 분홍
+    '#B5EAD7',  # 연한 민트
+    '#C7CEEA',  # 연한 하늘
+    '#FFDAC1',  # 연한 주황
+    '#E2BEF1',  # 연한 보라
+    '#FF9AA2',  # 연한 코랄
+    '#B5B9FF',  # 연한 라벤더
+    '#AFF8DB',  # 연한 청록
+]
+
+
+class Allocation:
+    """시간 재계산 결과
+
+    계산 시점의 열 값을 담아 두고, 표(DataFrame)는 to_dataframe()을
+    호출할 때에만 만든다. pandas도 그때 처음 import한다.
+    """
+
+    COLUMNS = ["할 일", "긴급도", "중요도", "할당 시간 (분)", "할당 시간"]
+
+    def __init__(self, names, urgency, importance, assigned, color_indices, ids=None):
+        self.names = names
         self.urgency = urgency
         self.importance = importance
-        self.assigned_time = 0  # 할당 시간은 계산되는 값
+        self.assigned = assigned
+        self.color_indices = color_indices
+        self.ids = ids if ids is not None else []
+        self._colors = None
 
-    def to_dict(self):
-        return {
-            "할 일": self.name,
-            "긴급도": self.urgency,
-            "중요도": self.importance
-        }
+    def __len__(self):
+        return len(self.names)
 
-    @classmethod
-    def from_dict(cls, data):
-        return cls(
-            name=data["할 일"],
-            urgency=data["긴급도"],
-            importance=data["중요도"]
-        )
+    def __iter__(self):
+        """이전 반환 형식 (DataFrame, 색상 목록)과의 호환"""
+        yield self.to_dataframe()
+        yield self.colors
+
+    @property
+    def colors(self):
+        """작업 순서대로의 색상 목록"""
+        if self._colors is None:
+            self._colors = [PASTEL_COLORS[i] for i in self.color_indices.tolist()]
+        return self._colors
+
+    def to_dataframe(self):
+        """표 형태로 변환"""
+        import pandas as pd
+
+        if not self.names:
+            return pd.DataFrame(columns=self.COLUMNS)
+        return pd.DataFrame({
+            "할 일": self.names,
+            "긴급도": self.urgency,
+            "중요도": self.importance,
+            "할당 시간 (분)": self.assigned,
+            "할당 시간": [f"{minutes//60}시간 {minutes%60}분"
+                      for minutes in self.assigned.tolist()]
+        }, columns=self.COLUMNS)
 
 
 class TaskManager:
-    def __init__(self):
-        self.tasks = []
+    def __init__(self, path=None, use_journal=True, save_delay=0.5, backend='json',
+                 read_only=False):
+        # 읽기 전용: 파일을 고치지 않고 변경 사항도 메모리에만 반영 (내보내기 등).
+        # 작업 파일이 없거나 깨졌으면 빈 목록으로 시작하지 않고 예외를 냄
+        self.read_only = read_only
+        package_dir = os.path.dirname(__file__)
+        if backend == 'sqlite':
+            # SQLite 저장소: 행 단위 수정, 작업 목록은 처음 필요할 때 로드
+            # (첫 화면이 전체 목록을 쓰므로 여는 시간은 줄지 않음)
+            self.path = path or os.path.join(package_dir, 'tasks.db')
+            self.store = SqliteTaskStore(
+                self.path, seed_path=os.path.splitext(self.path)[0] + '.json')
+        elif backend == 'json':
+            self.path = path or os.path.join(package_dir, 'tasks.json')
+            # 저널 모드: 변경 사항을 저널에 추가하고 백그라운드에서 스냅샷으로 합침
+            self.store = TaskJournal(self.path) if use_journal else None
+        else:
+            raise ValueError(f"지원하지 않는 저장소: {backend}")
+        # 저장은 작업 스레드에서 모아서 수행 (UI 스레드는 디스크를 기다리지 않음)
+        self._pending = []
+        # 작업 목록 변경과 저장용 스냅샷 생성도 이 잠금 안에서 (작업 스레드와 경쟁 방지)
+        self._lock = threading.RLock()
+        self._saver = SaveScheduler(self._write_pending, delay=save_delay)
+        self._task_store = TaskStore()  # 작업 속성을 담는 NumPy 열 저장소
+        self._index = {}  # id -> 작업
+        self._color_map = None
         self.available_minutes = 480  # 기본값 8시간
         self.available_hours = 8
         self.available_minutes_part = 0
         self._load_tasks()
-        self.color_map = self._create_color_map()
 
     def _load_tasks(self):
-        """JSON 파일에서 작업 목록 로드"""
-        try:
-            with open(os.path.join(os.path.dirname(__file__), 'tasks.json'), 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    # 총 시간 로드
-                    self.available_minutes = data.get('total_minutes', 480)
-                    self.available_hours = self.available_minutes // 60
-                    self.available_minutes_part = self.available_minutes % 60
-                    # 작업 목록 로드
-                    tasks_data = data.get('tasks', [])
-                    self.tasks = [Task.from_dict(task_data)
-                                  for task_data in tasks_data]
-                else:
-                    self.tasks = [Task.from_dict(task_data)
-                                  for task_data in data]
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.tasks = []
+        """저장소에서 총 시간과 작업 목록 로드 (저널 모드에서는 저널까지 재생)"""
+        if self.store is not None:
+            data = self.store.load(compact=not self.read_only, strict=self.read_only)
+        else:
+            data = read_snapshot(self.path, strict=self.read_only)
 
-    def _save_tasks(self):
-        """작업 목록을 JSON 파일로 저장"""
-        data = {
+        # 총 시간 로드
+        self.available_minutes = data.get('total_minutes', 480)
+        self.available_hours = self.available_minutes // 60
+        self.available_minutes_part = self.available_minutes % 60
+        # 작업 목록 로드 (None이면 처음 접근할 때 로드)
+        if data['tasks'] is None:
+            self._task_store = None
+        else:
+            self._set_tasks(data['tasks'])
+
+    def _set_tasks(self, tasks_data):
+        """작업 열 저장소와 id 색인 구성"""
+        self._task_store = TaskStore.from_dicts(tasks_data, len(PASTEL_COLORS))
+        self._index = dict(zip(self._task_store.ids, self._task_store.tasks))
+        # id나 색상이 없던 이전 형식의 작업은 새로 받은 값을 바로 저장
+        if not self.read_only and any("id" not in task_data or "색상" not in task_data
+                                      for task_data in tasks_data):
+            self._save_tasks()
+
+    @property
+    def tasks(self):
+        """작업 목록 (지연 로드 저장소는 처음 접근할 때 전체를 읽음)"""
+        if self._task_store is None:
+            self._saver.flush()  # 아직 기록되지 않은 변경 사항까지 포함해서 읽음
+            self._set_tasks(self.store.load_tasks())
+        return self._task_store.tasks
+
+    def get_task(self, task_id):
+        """id로 작업 찾기"""
+        if self._task_store is None:
+            self.tasks  # 지연 로드
+        return self._index.get(task_id)
+
+    @property
+    def color_map(self):
+        """작업별 색상 (작업 목록이 바뀐 뒤 처음 접근할 때 다시 만듦)"""
+        if self._color_map is None:
+            self._color_map = self._create_color_map()
+        return self._color_map
+
+    def _snapshot_data(self):
+        """현재 상태 전체를 저장용 데이터로 변환"""
+        return {
             'total_minutes': self.available_minutes,
             'tasks': [task.to_dict() for task in self.tasks]
         }
-        with open(os.path.join(os.path.dirname(__file__), 'tasks.json'), 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _save_tasks(self):
+        """작업 목록 전체를 JSON 파일로 즉시 저장"""
+        if self.read_only:
+            return
+        # 예약된 레코드가 스냅샷 뒤에 다시 적용되지 않도록 먼저 비움
+        self._saver.flush()
+        data = self._snapshot_data()
+        if self.store is not None:
+            self.store.write_snapshot(data)
+        else:
+            atomic_write_json(self.path, data)
+
+    def _record(self, record):
+        """변경 사항 기록 후 저장 예약"""
+        if self.read_only:
+            return
+        with self._lock:
+            last = self._pending[-1] if self._pending else None
+            # 슬라이더처럼 같은 값을 연달아 바꾸는 경우 마지막 레코드만 유지
+            if last is not None and last['op'] == record['op'] and (
+                    record['op'] == 'total' or
+                    (record['op'] == 'update' and last['id'] == record['id'])):
+                self._pending[-1] = record
+            else:
+                self._pending.append(record)
+        self._saver.schedule()
+
+    def _write_pending(self):
+        """작업 스레드에서 호출: 모인 변경 사항을 디스크에 기록"""
+        with self._lock:
+            records, self._pending = self._pending, []
+            data = self._snapshot_data() if self.store is None else None
+
+        if self.store is not None:
+            try:
+                self.store.append(*records)
+            except Exception:
+                with self._lock:
+                    self._pending[:0] = records
+                raise
+        else:
+            atomic_write_json(self.path, data)
+
+    def flush(self):
+        """예약된 저장을 즉시 수행하고 디스크에 기록될 때까지 대기"""
+        self._saver.flush()
+
+    def close(self):
+        """남은 변경 사항을 저장하고 저장소 닫기"""
+        self._saver.close()
+        if self.store is not None:
+            self.store.close()
 
     def _create_color_map(self):
         """각 작업에 대한 색상 맵 생성"""
-        # 파스텔톤 색상 팔레트
-        pastel_colors = [
-            '#FFB3BA',  # 연한 빨강
-            '#BAFFC9',  # 연한 초록
-            '#BAE1FF',  # 연한 파랑
-            '#FFFFBA',  # 연한 노랑
-            '#FFB3F7',  # 연한 분홍
-            '#B5EAD7',  # 연한 민트
-            '#C7CEEA',  # 연한 하늘
-            '#FFDAC1',  # 연한 주황
-            '#E2BEF1',  # 연한 보라
-            '#FF9AA2',  # 연한 코랄
-            '#B5B9FF',  # 연한 라벤더
-            '#AFF8DB',  # 연한 청록
-        ]
-
-        colors = {}
-        for i, task in enumerate(self.tasks):
-            colors[task.name] = pastel_colors[i % len(pastel_colors)]
-        return colors
+        self.tasks  # 지연 로드
+        store = self._task_store
+        return {task_id: PASTEL_COLORS[color_index]
+                for task_id, color_index in zip(store.ids, store.color_index[:store.size])}
 
     def add_task(self, name, urgency=3, importance=3):
         """새로운 작업 추가"""
         task = Task(name=name, urgency=urgency, importance=importance)
-        self.tasks.append(task)
-        self._save_tasks()
-        self.color_map = self._create_color_map()
+        self.tasks  # 지연 로드 (새 색상은 지금 쓰이는 색상을 보고 정함)
+        with self._lock:
+            store = self._task_store
+            # 색상은 추가될 때 가장 적게 쓰인 색상으로 정해지고 저장되며 이후에는 바뀌지 않음
+            store.adopt(task, color_index=store.next_color(len(PASTEL_COLORS)))
+            self._index[task.id] = task
+            self._record({'op': 'add', 'task': task.to_dict()})
+        self._color_map = None
+        return task
 
-    def remove_task(self, task_name):
+    def remove_task(self, task_id):
         """작업 제거"""
-        self.tasks = [task for task in self.tasks if task.name != task_name]
-        self._save_tasks()
-        self.color_map = self._create_color_map()
+        with self._lock:
+            task = self._index.pop(task_id, None)
+            if task is not None:
+                self._task_store.remove(task)
+            self._record({'op': 'remove', 'id': task_id})
+        self._color_map = None
+
+    def clear_tasks(self):
+        """모든 작업 제거"""
+        with self._lock:
+            self._task_store = TaskStore()
+            self._index = {}
+            self._record({'op': 'clear'})
+        self._color_map = None
 
-    def update_task_position(self, task_name, urgency, importance):
+    def update_task_position(self, task_id, urgency, importance):
         """작업의 위치(긴급도, 중요도) 업데이트"""
-        for task in self.tasks:
-            if task.name == task_name:
+        with self._lock:
+            task = self._index.get(task_id)
+            if task is not None:
                 task.urgency = urgency
                 task.importance = importance
-                break
-        self._save_tasks()
+            self._record({'op': 'update', 'id': task_id,
+                          '긴급도': urgency, '중요도': importance})
+
+    def assigned_minutes(self, task_id, total_minutes=None):
+        """작업 하나의 할당 시간 (누적 우선순위 합을 사용해 O(1)로 계산)"""
+        task = self.get_task(task_id)
+        if task is None:
+            return 0
+        if total_minutes is None:
+            total_minutes = self.available_minutes
+        return self._task_store.assigned_for(task._row, total_minutes)
+
+    def aggregates(self):
+        """우선순위 합계와 사분면별 우선순위 합계/작업 수"""
+        self.tasks  # 지연 로드
+        store = self._task_store
+        return {
+            'count': store.size,
+            'total_priority': store.total_priority,
+            'quadrants': {
+                name: {'priority': store.quadrant_priority[i],
+                       'count': store.quadrant_count[i]}
+                for i, name in enumerate(QUADRANTS)
+            }
+        }
+
+    def preview_allocation(self, task_id, urgency, importance):
+        """작업을 (긴급도, 중요도)로 옮겼을 때의 할당 결과 (저장하지 않음)"""
+        task = self.get_task(task_id)
+        if task is None:
+            return self._calculate_time_distribution()
+        store = self._task_store
+        n = store.size
+        row = task._row
+        urgency_column = store.urgency[:n].copy()
+        importance_column = store.importance[:n].copy()
+        urgency_column[row] = urgency
+        importance_column[row] = importance
+        return Allocation(
+            list(store.names),
+            urgency_column,
+            importance_column,
+            store.preview_allocate(row, urgency, importance, self.available_minutes),
+            store.color_index[:n].copy(),
+            list(store.ids)
+        )
 
     def recalculate_time(self, total_minutes):
-        """작업 시간 재계산"""
-        self.available_minutes = total_minutes
-        self.available_hours = total_minutes // 60
-        self.available_minutes_part = total_minutes % 60
-        self._save_tasks()  # 총 시간 변경 시 저장
-        return self._calculate_time_distribution()
-
-    def _calculate_time_distribution(self):
+        """작업 시간 재계산 (결과는 Allocation, 표는 필요할 때 to_dataframe()으로)"""
+        with self._lock:
+            changed = total_minutes != self.available_minutes
+            self.available_minutes = total_minutes
+            self.available_hours = total_minutes // 60
+            self.available_minutes_part = total_minutes % 60
+            if changed:  # 총 시간 변경 시 저장
+                self._record({'op': 'total', 'total_minutes': total_minutes})
+        # 슬라이더로 총 시간만 바뀌는 경우에는 미리 계산한 할당 행렬에서 조회
+        return self._calculate_time_distribution(use_sweep=changed)
+
+    def _calculate_time_distribution(self, use_sweep=False):
         """총 시간을 기준으로 각 작업의 시간 재계산"""
-        if not self.tasks:
-            return pd.DataFrame(columns=["할 일", "긴급도", "중요도", "할당 시간 (분)", "할당 시간"]), []
-
-        # 우선순위 계산
-        total_priority = sum(
-            task.urgency * task.importance for task in self.tasks)
-
-        # 시간 할당
-        for task in self.tasks:
-            if total_priority > 0:
-                priority = task.urgency * task.importance
-                task.assigned_time = int(
-                    (priority / total_priority) * self.available_minutes)
-            else:
-                task.assigned_time = 0
-
-        # DataFrame 생성
-        df = pd.DataFrame([
-            {
-                "할 일": task.name,
-                "긴급도": task.urgency,
-                "중요도": task.importance,
-                "할당 시간 (분)": task.assigned_time,
-                "할당 시간": f"{task.assigned_time//60}시간 {task.assigned_time%60}분"
-            }
-            for task in self.tasks
-        ])
+        self.tasks  # 지연 로드
+        store = self._task_store
+        n = store.size
 
-        return df, [self.color_map[task.name] for task in self.tasks]
+        assigned = None
+        if use_sweep:
+            # 할당 행렬의 행은 읽기 전용이라 복사 없이 결과에 담음
+            assigned = store.allocate_from_sweep(
+                self.available_minutes,
+                MIN_TOTAL_MINUTES, MAX_TOTAL_MINUTES, TOTAL_MINUTES_STEP)
+        if assigned is None:
+            # 우선순위 계산과 시간 할당을 열 단위로 한 번에 수행
+            assigned = store.allocate(self.available_minutes).copy()
+
+        return Allocation(
+            list(store.names),
+            store.urgency[:n].copy(),
+            store.importance[:n].copy(),
+            assigned,
+            store.color_index[:n].copy(),
+            list(store.ids)
+        )
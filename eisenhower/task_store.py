@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+
+import uuid
+
+import numpy as np
+
+from .quadrant import QUADRANTS, quadrant_of, quadrants_of
+
+
+def new_task_id():
+    """새 작업 id 생성"""
+    return uuid.uuid4().hex[:16]
+
+
+class Task:
+    """TaskStore의 한 행을 가리키는 가벼운 뷰
+
+    속성 값은 저장소의 NumPy 열에 있고 Task는 (저장소, 행 번호)만 가진다.
+    TaskManager 밖에서 만든 작업은 한 행짜리 저장소를 따로 가진다.
+    """
+
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, name, urgency=3, importance=3, task_id=None):
+        TaskStore(capacity=1).append(
+            task_id or new_task_id(), name, urgency, importance, view=self)
+
+    @property
+    def id(self):
+        return self._store.ids[self._row]
+
+    @property
+    def name(self):
+        return self._store.names[self._row]
+
+    @name.setter
+    def name(self, value):
+        self._store.names[self._row] = value
+
+    @property
+    def urgency(self):
+        return int(self._store.urgency[self._row])
+
+    @urgency.setter
+    def urgency(self, value):
+        self._store.set_position(self._row, value, self.importance)
+
+    @property
+    def importance(self):
+        return int(self._store.importance[self._row])
+
+    @importance.setter
+    def importance(self, value):
+        self._store.set_position(self._row, self.urgency, value)
+
+    @property
+    def assigned_time(self):
+        """할당 시간 (분) - 계산되는 값"""
+        return int(self._store.assigned_time[self._row])
+
+    @assigned_time.setter
+    def assigned_time(self, value):
+        self._store.assigned_time[self._row] = value
+
+    @property
+    def color_index(self):
+        """팔레트에서의 색상 번호"""
+        return int(self._store.color_index[self._row])
+
+    @property
+    def quadrant(self):
+        """작업이 속한 사분면 번호"""
+        return quadrant_of(self.urgency, self.importance)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "할 일": self.name,
+            "긴급도": self.urgency,
+            "중요도": self.importance,
+            "색상": self.color_index
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data["할 일"],
+            urgency=data["긴급도"],
+            importance=data["중요도"],
+            task_id=data.get("id")
+        )
+
+
+class TaskStore:
+    """작업 속성을 NumPy 열로 보관하는 구조체 배열(struct-of-arrays) 저장소
+
+    행 순서가 곧 작업 목록 순서다. 제거하면 뒤의 행들이 한 칸씩 당겨지므로 순서가
+    저장된 목록(스냅샷, 저널 재생 결과)과 항상 같다.
+    """
+
+    def __init__(self, capacity=16):
+        capacity = max(capacity, 1)
+        self.size = 0
+        self.ids = []
+        self.names = []
+        self.tasks = []  # 행 -> Task 뷰
+        self.urgency = np.zeros(capacity, dtype=np.int8)
+        self.importance = np.zeros(capacity, dtype=np.int8)
+        self.assigned_time = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int8)
+        # 변경될 때마다 O(1)로 갱신하는 집계값
+        self.total_priority = 0
+        self.quadrant_priority = [0] * len(QUADRANTS)
+        self.quadrant_count = [0] * len(QUADRANTS)
+        # 총 시간 후보별 할당 행렬 캐시 (우선순위가 바뀔 때만 무효화)
+        self._sweep = None
+        self._sweep_key = None
+
+    @classmethod
+    def from_dicts(cls, tasks_data, n_colors):
+        """작업 딕셔너리 목록으로 저장소 생성
+
+        색상은 저장된 값을 쓰고, 색상이 없는 이전 형식의 작업에는 가장 적게 쓰인
+        색상을 목록 순서대로 배정한다.
+        """
+        n = len(tasks_data)
+        store = cls(capacity=n)
+        store.size = n
+        store.ids = [data.get("id") or new_task_id() for data in tasks_data]
+        store.names = [data["할 일"] for data in tasks_data]
+        store.urgency[:n] = [data["긴급도"] for data in tasks_data]
+        store.importance[:n] = [data["중요도"] for data in tasks_data]
+        colors = [data.get("색상") for data in tasks_data]
+        if None in colors:
+            counts = np.bincount([color % n_colors for color in colors if color is not None],
+                                 minlength=n_colors)
+            for row, color in enumerate(colors):
+                if color is None:
+                    colors[row] = color = int(np.argmin(counts))
+                    counts[color] += 1
+        store.color_index[:n] = np.asarray(colors, dtype=np.int64) % n_colors
+        store.tasks = [store._view(row) for row in range(n)]
+
+        # 집계값 초기화
+        priority = store.priorities()
+        quadrants = quadrants_of(store.urgency[:n], store.importance[:n])
+        store.total_priority = int(priority.sum())
+        store.quadrant_priority = np.bincount(
+            quadrants, weights=priority, minlength=len(QUADRANTS)).astype(int).tolist()
+        store.quadrant_count = np.bincount(
+            quadrants, minlength=len(QUADRANTS)).tolist()
+        return store
+
+    def __len__(self):
+        return self.size
+
+    def _view(self, row, view=None):
+        if view is None:
+            view = Task.__new__(Task)
+        view._store = self
+        view._row = row
+        return view
+
+    def _columns(self):
+        return (self.urgency, self.importance, self.assigned_time, self.color_index)
+
+    def _grow(self):
+        capacity = len(self.urgency) * 2
+        for name in ('urgency', 'importance', 'assigned_time', 'color_index'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, task_id, name, urgency, importance, color_index=0, view=None):
+        """행 추가 후 해당 행의 Task 뷰 반환"""
+        if self.size == len(self.urgency):
+            self._grow()
+        row = self.size
+        self.size += 1
+        self.ids.append(task_id)
+        self.names.append(name)
+        self.urgency[row] = urgency
+        self.importance[row] = importance
+        self.assigned_time[row] = 0
+        self.color_index[row] = color_index
+        self._count(int(self.urgency[row]), int(self.importance[row]), 1)
+        self._sweep = None
+        view = self._view(row, view)
+        self.tasks.append(view)
+        return view
+
+    def adopt(self, task, color_index=0):
+        """다른 저장소의 작업을 이 저장소로 옮기고 같은 뷰를 다시 연결"""
+        return self.append(task.id, task.name, task.urgency, task.importance,
+                           color_index, view=task)
+
+    def next_color(self, n_colors):
+        """새 작업의 색상 번호 (지금 가장 적게 쓰인 색상, 같으면 번호가 작은 것)"""
+        counts = np.bincount(self.color_index[:self.size], minlength=n_colors)
+        return int(np.argmin(counts[:n_colors]))
+
+    def remove(self, task):
+        """작업 제거 (뒤의 행들을 한 칸씩 당겨 순서 유지)"""
+        row = task._row
+        last = self.size - 1
+        values = (task.id, task.name, task.urgency, task.importance, task.color_index)
+        assigned_time = task.assigned_time
+        self._count(task.urgency, task.importance, -1)
+
+        for column in self._columns():
+            column[row:last] = column[row + 1:last + 1]
+        del self.ids[row]
+        del self.names[row]
+        del self.tasks[row]
+        for moved_row in range(row, last):
+            self.tasks[moved_row]._row = moved_row
+        self.size = last
+        self._sweep = None
+
+        # 제거된 뷰는 한 행짜리 저장소로 떼어내서 계속 읽을 수 있게 함
+        TaskStore(capacity=1).append(*values, view=task)
+        task.assigned_time = assigned_time
+
+    def set_position(self, row, urgency, importance):
+        """행의 긴급도/중요도 변경"""
+        old_urgency = int(self.urgency[row])
+        old_importance = int(self.importance[row])
+        if old_urgency == urgency and old_importance == importance:
+            return
+        self._count(old_urgency, old_importance, -1)
+        self.urgency[row] = urgency
+        self.importance[row] = importance
+        self._count(int(self.urgency[row]), int(self.importance[row]), 1)
+        self._sweep = None
+
+    def _count(self, urgency, importance, sign):
+        """작업 하나를 집계값에 더하거나(sign=1) 뺌(sign=-1)"""
+        priority = urgency * importance
+        quadrant = quadrant_of(urgency, importance)
+        self.total_priority += sign * priority
+        self.quadrant_priority[quadrant] += sign * priority
+        self.quadrant_count[quadrant] += sign
+
+    def assigned_for(self, row, total_minutes):
+        """한 작업의 할당 시간만 계산 (전체 작업을 훑지 않음)"""
+        if self.total_priority <= 0:
+            return 0
+        priority = int(self.urgency[row]) * int(self.importance[row])
+        return int((priority / self.total_priority) * total_minutes)
+
+    def priorities(self):
+        """모든 작업의 우선순위(긴급도 x 중요도) 배열"""
+        n = self.size
+        return self.urgency[:n].astype(np.int32) * self.importance[:n]
+
+    def allocate(self, total_minutes):
+        """우선순위 비율로 총 시간을 나눠 assigned_time 열에 기록"""
+        n = self.size
+        if n == 0:
+            return self.assigned_time[:0]
+        priority = self.priorities()
+        total_priority = self.total_priority
+        if total_priority > 0:
+            self.assigned_time[:n] = (
+                priority / total_priority) * total_minutes
+        else:
+            self.assigned_time[:n] = 0
+        return self.assigned_time[:n]
+
+    def preview_allocate(self, row, urgency, importance, total_minutes):
+        """한 작업의 위치만 바꿨을 때의 할당 시간 (저장소는 바꾸지 않음)
+
+        누적 우선순위 합에 그 작업의 우선순위 변화량만 더해 새 합을 구하고,
+        나머지 작업은 같은 우선순위로 한 번에 다시 나눈다.
+        """
+        n = self.size
+        if n == 0:
+            return self.assigned_time[:0].copy()
+        priority = self.priorities()
+        new_priority = urgency * importance
+        total_priority = self.total_priority + new_priority - int(priority[row])
+        assigned = np.zeros(n, dtype=self.assigned_time.dtype)
+        if total_priority > 0:
+            assigned[:] = (priority / total_priority) * total_minutes
+            assigned[row] = int((new_priority / total_priority) * total_minutes)
+        return assigned
+
+    def allocation_sweep(self, start, stop, step):
+        """총 시간 start..stop(step 간격) 전체에 대한 할당 행렬
+
+        행은 총 시간 후보, 열은 작업이다. 한 번의 브로드캐스트 연산으로 만들고
+        우선순위가 바뀌기 전까지 재사용한다. allocate()와 같은 부동소수점 연산
+        순서를 쓰므로 결과도 같다.
+        """
+        key = (start, stop, step)
+        if self._sweep is not None and self._sweep_key == key:
+            return self._sweep
+
+        totals = np.arange(start, stop + 1, step, dtype=np.float64)
+        priority = self.priorities()
+        total_priority = self.total_priority
+        if self.size == 0 or total_priority <= 0:
+            sweep = np.zeros((len(totals), self.size), dtype=np.int16)
+        else:
+            share = priority / total_priority
+            sweep = (share[np.newaxis, :] * totals[:, np.newaxis]).astype(np.int16)
+        sweep.flags.writeable = False  # 결과에서 행을 그대로 공유하므로 읽기 전용
+
+        self._sweep = sweep
+        self._sweep_key = key
+        return sweep
+
+    def allocate_from_sweep(self, total_minutes, start, stop, step):
+        """미리 계산한 할당 행렬에서 한 행을 골라 assigned_time 열에 기록
+
+        total_minutes가 후보 격자 위에 없으면 None을 반환한다.
+        """
+        if not start <= total_minutes <= stop:
+            return None
+        index, remainder = divmod(total_minutes - start, step)
+        if remainder != 0:
+            return None
+        row = self.allocation_sweep(start, stop, step)[int(index)]
+        self.assigned_time[:self.size] = row
+        return row
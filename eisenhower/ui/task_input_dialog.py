@@ -1,7 +1,7 @@
 from PyQt5.QtWidgets import QDialog, QLineEdit, QVBoxLayout, QPushButton, QApplication, QHBoxLayout, QLabel, QWidget
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFontDatabase
-import platform
+
+from ..font_cache import qt_font_family
 
 
 class TaskInputDialog(QDialog):
@@ -10,14 +10,12 @@ class TaskInputDialog(QDialog):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
         self.setAttribute(Qt.WA_TranslucentBackground)  # 배경을 투명하게 설정
 
-        # Maplestory 폰트 설정
-        extension = ".ttf" if platform.system() == "Windows" else ".otf"
-        font_path = f"./eisenhower/fonts/Maplestory Light{extension}"
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id < 0:
+        # Maplestory 폰트 설정 (글꼴 등록은 프로세스마다 한 번)
+        font_family = qt_font_family()
+        if font_family is None:
             print("폰트 로드 실패")
+            font_family = QApplication.font().family()
         else:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
             font = QApplication.font()
             font.setFamily(font_family)
             QApplication.setFont(font)
@@ -130,6 +128,12 @@ class TaskInputDialog(QDialog):
         # 입력 필드에 포커스
         self.input_field.setFocus()
 
+    def reset(self):
+        """다시 열기 전에 입력 내용 비우기 (다이얼로그는 재사용)"""
+        self.input_field.clear()
+        self.input_field.setFocus()
+        self.old_pos = None
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.old_pos = event.globalPos()
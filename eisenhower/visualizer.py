@@ -1,118 +1,107 @@
 # -*- coding: utf-8 -*-
 
 
-import random
-import platform
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 from matplotlib.widgets import Button, Slider, TextBox
 
-from .ui.task_input_dialog import TaskInputDialog, QDialog
-from .components.pie_chart import PieChart
-from .components.matrix import Matrix
+from . import font_cache
+from .components.backend import MatplotlibBackend
+from .components.dispatcher import EventDispatcher
+from .controller import TaskController
+from .task_manager import MIN_TOTAL_MINUTES, MAX_TOTAL_MINUTES, TOTAL_MINUTES_STEP
 
 
-class EisenhowerVisualizer:
-    def __init__(self, task_manager):
-        self.task_manager = task_manager
+class TimeInputBox(TextBox):
+    """입력 중이 아닐 때는 다른 곳을 클릭해도 그림 전체를 다시 그리지 않는 TextBox"""
+
+    def stop_typing(self):
+        # TextBox는 그림의 아무 곳이나 클릭할 때마다 stop_typing에서 canvas.draw()를 호출함
+        if not self.capturekeystrokes:
+            return
+        super().stop_typing()
+
+
+class EisenhowerVisualizer(TaskController):
+    """matplotlib 그림에 그리는 화면 (인터랙션 로직은 TaskController)
+
+    backend를 주지 않으면 setup_initial_plot에서 그림에 MatplotlibBackend를 만든다.
+    캔버스 이벤트와 matplotlib 위젯을 컨트롤러의 (긴급도, 중요도) 좌표 호출로 바꾼다.
+    """
+
+    def __init__(self, task_manager, backend=None):
+        super().__init__(task_manager, backend)
         self.fig = None
-        self.pie_chart = None
-        self.matrix = None
-        self.selected_point = None
-        self.is_dragging = False
-        self.last_update_time = 0
-        self.update_interval = 0.05
         self.base_font_size = 12
         self.font_mult = 1.0
-        self.background = None  # blit을 위한 배경 저장
+        self.renderer = None  # 동적 아티스트만 다시 그리는 렌더링 파이프라인
+        self.dispatcher = None  # 캔버스 이벤트를 구성 요소별로 전달
+        self.scheduler = None  # 슬라이더/입력/드래그 갱신을 프레임 단위로 합침
 
         # 폰트 설정
         self._setup_fonts()
 
     def _setup_fonts(self):
-        # Maplestory 폰트 로드
-        extension = ".ttf" if platform.system() == "Windows" else ".otf"
-        font_path = f"./eisenhower/fonts/Maplestory Light{extension}"
-        fm.fontManager.addfont(font_path)
-        font_prop = fm.FontProperties(fname=font_path)
-        plt.rcParams['font.family'] = font_prop.get_name()
-        plt.rcParams['font.size'] = self.base_font_size * self.font_mult
-        plt.rcParams['axes.unicode_minus'] = False
-
-    def setup_initial_plot(self):
-        # 그림과 축 설정
-        self.fig, axes = plt.subplots(1, 2, figsize=(17, 10))
-
-        # 파이 차트와 매트릭스 초기화
-        self.pie_chart = PieChart(axes[0], self.base_font_size)
-        self.matrix = Matrix(axes[1], self.base_font_size)
-
-        # 초기 데이터로 그리기
-        self._update_plots(self.task_manager.available_minutes)
+        # Maplestory 폰트 사용 (등록은 프로세스마다 한 번)
+        font_cache.setup_matplotlib(self.base_font_size * self.font_mult)
+
+    def setup_initial_plot(self, fig=None):
+        # 그림과 축 설정 (fig를 주면 Qt 창 등에 이미 붙어 있는 그림에 그림)
+        if self.backend is None:
+            if fig is None:
+                import matplotlib.pyplot as plt
+                fig = plt.figure(figsize=(17, 10))
+            # 파이 차트와 매트릭스 초기화
+            self.set_backend(MatplotlibBackend(fig, self.base_font_size))
+        self.fig = self.backend.fig
+        self.renderer = self.backend.renderer
+        self.scheduler = self.backend.scheduler
 
         # 레이아웃 조정
-        plt.subplots_adjust(left=0.05, right=0.95,
+        self.fig.subplots_adjust(left=0.05, right=0.95,
                             top=0.95, bottom=0.25, wspace=0.2)
 
         # 인터랙션 설정
         self.setup_interaction()
 
-        # 배경 저장 (점을 그리기 전에)
-        self.fig.canvas.draw()
-        self.background = self.fig.canvas.copy_from_bbox(self.matrix.ax.bbox)
-
-        # 점 그리기
-        _, sorted_colors = self.task_manager.recalculate_time(
-            self.task_manager.available_minutes)
-        self.matrix.draw(self.task_manager.tasks, sorted_colors)
-
-    def _update_plots(self, total_minutes):
-        """플롯 업데이트"""
-        # 시간 재계산
-        df_updated, sorted_colors = self.task_manager.recalculate_time(
-            total_minutes)
-
-        # 파이 차트 업데이트
-        self.pie_chart.draw(
-            self.task_manager.tasks,
-            self.task_manager.available_hours,
-            self.task_manager.available_minutes_part,
-            sorted_colors
-        )
-
-        # 매트릭스 업데이트
-        self.matrix.draw(self.task_manager.tasks, sorted_colors)
-
-        # 폰트 크기 설정 유지
-        plt.rcParams['font.size'] = self.base_font_size * self.font_mult
-        self.update_all_text_sizes()
+        # 슬라이더와 입력 필드도 매번 다시 그리는 영역으로 등록
+        self.renderer.add_layer(
+            'controls', self.slider.ax,
+            # 슬라이더는 축 전체(막대, 손잡이, 값)를 공개 아티스트로 다시 그림
+            lambda: [self.slider.ax, self.time_input.text_disp],
+            extent_artists=lambda: [self.slider.label, self.time_input.ax])
 
-        # 배경 업데이트
-        self.fig.canvas.draw()
-        self.background = self.fig.canvas.copy_from_bbox(self.matrix.ax.bbox)
+        # 초기 데이터로 그리기
+        self.update_plots()
 
     def setup_interaction(self):
-        # 이벤트 핸들러 연결
-        self.fig.canvas.mpl_connect('button_press_event', self.on_press)
-        self.fig.canvas.mpl_connect('motion_notify_event', self.on_motion)
-        self.fig.canvas.mpl_connect('button_release_event', self.on_release)
+        # 이벤트 핸들러 연결 (캔버스에는 한 번만 연결하고 축별로 전달)
+        self.dispatcher = EventDispatcher(self.fig.canvas)
+        self.dispatcher.register(
+            'matrix', self.matrix.ax,
+            on_press=self.on_press, on_motion=self.on_motion,
+            on_release=self.on_release)
+        self.dispatcher.register(
+            'pie', self.pie_chart.ax, on_press=self.on_pie_click)
 
         # 슬라이더 설정
-        ax_slider = plt.axes([0.15, 0.1, 0.69, 0.05])
+        ax_slider = self.fig.add_axes([0.15, 0.1, 0.69, 0.05])
         self.slider = Slider(
             ax_slider,
             '총 시간 (분)',
-            30, 600,
+            MIN_TOTAL_MINUTES, MAX_TOTAL_MINUTES,
             valinit=self.task_manager.available_minutes,
-            valstep=5,
+            valstep=TOTAL_MINUTES_STEP,
+            valfmt='%d',  # 기본 형식은 값이 바뀔 때마다 mathtext를 다시 파싱함
             color='#00a0a0',
             initcolor='none'
         )
+        self.slider.drawon = False  # 다시 그리기는 렌더링 파이프라인에서
+        # 값은 오른쪽 입력 필드가 보여 줌 (슬라이더 축과 함께 다시 그리면 입력 필드 위에 겹침)
+        self.slider.valtext.set_visible(False)
         self.slider.on_changed(self.on_slider_changed)
 
         # 시간 입력 필드 설정
-        time_input_ax = plt.axes([0.85, 0.1, 0.1, 0.05])
-        self.time_input = TextBox(
+        time_input_ax = self.fig.add_axes([0.85, 0.1, 0.1, 0.05])
+        self.time_input = TimeInputBox(
             time_input_ax,
             '',
             initial=str(self.task_manager.available_minutes),
@@ -122,7 +111,7 @@ class EisenhowerVisualizer:
         self.time_input.on_submit(self.on_time_input_changed)
 
         # 리셋 버튼 설정
-        reset_ax = plt.axes([0.85, 0.02, 0.1, 0.05])
+        reset_ax = self.fig.add_axes([0.85, 0.02, 0.1, 0.05])
         self.reset_button = Button(
             reset_ax,
             'Reset',
@@ -132,7 +121,7 @@ class EisenhowerVisualizer:
         self.reset_button.on_clicked(self.reset)
 
         # 폰트 크기 버튼 설정
-        font_size_increase_ax = plt.axes([0.6, 0.02, 0.1, 0.05])
+        font_size_increase_ax = self.fig.add_axes([0.6, 0.02, 0.1, 0.05])
         self.font_size_increase_button = Button(
             font_size_increase_ax,
             '폰트 크기 +',
@@ -141,7 +130,7 @@ class EisenhowerVisualizer:
         )
         self.font_size_increase_button.on_clicked(self.increase_font_size)
 
-        font_size_decrease_ax = plt.axes([0.7, 0.02, 0.1, 0.05])
+        font_size_decrease_ax = self.fig.add_axes([0.7, 0.02, 0.1, 0.05])
         self.font_size_decrease_button = Button(
             font_size_decrease_ax,
             '폰트 크기 -',
@@ -151,7 +140,7 @@ class EisenhowerVisualizer:
         self.font_size_decrease_button.on_clicked(self.decrease_font_size)
 
         # 할 일 추가 버튼 설정
-        add_task_ax = plt.axes([0.5, 0.02, 0.1, 0.05])
+        add_task_ax = self.fig.add_axes([0.5, 0.02, 0.1, 0.05])
         self.add_task_button = Button(
             add_task_ax,
             '할 일 추가',
@@ -160,158 +149,88 @@ class EisenhowerVisualizer:
         )
         self.add_task_button.on_clicked(self.add_task)
 
+        # 위젯은 자체적으로 이벤트를 처리하므로 전달 횟수만 셈
+        self.dispatcher.register('widgets', [
+            ax_slider, time_input_ax, reset_ax, font_size_increase_ax,
+            font_size_decrease_ax, add_task_ax])
+
     def on_slider_changed(self, val):
-        # 슬라이더 값 변경 시 호출 - 부드러운 업데이트
-        import time
-        current_time = time.time()
-
-        # 업데이트 간격 조절 (throttling)
-        if current_time - self.last_update_time > self.update_interval:
-            self.last_update_time = current_time
-            self._update_plots(val)
-            # 입력 필드 값도 업데이트
-            self.time_input.set_val(str(int(val)))
-            # 파이 차트 제목 업데이트
-            self.pie_chart.ax.set_title(
-                f"오늘의 일정 (총 {val//60}시간 {val%60}분)",
-                fontsize=self.base_font_size * self.font_mult * 1.5
-            )
-            self.fig.canvas.draw_idle()
+        # 슬라이더 값 변경 시 호출 - 프레임마다 마지막 값으로 한 번만 갱신
+        self.request_total_minutes(val)
 
     def on_time_input_changed(self, text):
         """시간 입력 필드 값 변경 시 호출"""
         try:
             minutes = int(text)
-            if 30 <= minutes <= 600:
-                self.task_manager.available_minutes = minutes
-                self._update_plots(minutes)
-                # 슬라이더 값도 업데이트
-                self.slider.set_val(minutes)
-                # 파이 차트 제목 업데이트
-                self.pie_chart.ax.set_title(
-                    f"오늘의 일정 (총 {minutes//60}시간 {minutes%60}분)",
-                    fontsize=self.base_font_size * self.font_mult * 1.5
-                )
-                self.fig.canvas.draw_idle()
+            if MIN_TOTAL_MINUTES <= minutes <= MAX_TOTAL_MINUTES:
+                self.request_total_minutes(minutes)
         except ValueError:
             # 유효하지 않은 입력은 무시
             pass
 
-    def on_press(self, event):
-        if event.inaxes != self.matrix.ax:
-            return
+    def _sync_controls(self, minutes):
+        """슬라이더와 입력 필드 표시 맞추기 (서로의 콜백과 전체 다시 그리기 없이)"""
+        self.slider.eventson = False
+        self.slider.set_val(minutes)
+        self.slider.eventson = True
+        # TextBox.set_val은 커서 위치 계산 때문에 매번 전체를 다시 그림
+        self.time_input.text_disp.set_text(str(int(minutes)))
 
-        # 클릭한 위치에서 가장 가까운 점 찾기
-        point = self.matrix.get_point_at_position(event.xdata, event.ydata)
-        if point is not None:
-            self.selected_point = point
-            self.is_dragging = True
+    def event_stats(self):
+        """이벤트 전달 횟수와 연결된 핸들러 수"""
+        return self.dispatcher.stats()
 
-            # 선택된 점을 임시로 숨기고 배경 저장
-            if self.selected_point.scatter is not None:
-                self.selected_point.scatter.set_visible(False)
-            if self.selected_point.text is not None:
-                self.selected_point.text.set_visible(False)
+    def frame_stats(self):
+        """렌더링 프레임 시간 요약"""
+        return self.renderer.stats.summary()
 
-            self.fig.canvas.draw()
-            self.background = self.fig.canvas.copy_from_bbox(
-                self.matrix.ax.bbox)
+    def scheduler_stats(self):
+        """프레임 스케줄러가 합치거나 버린 요청 수"""
+        return self.scheduler.stats()
 
-            # 선택된 점 다시 보이게 설정
-            if self.selected_point.scatter is not None:
-                self.selected_point.scatter.set_visible(True)
-            if self.selected_point.text is not None:
-                self.selected_point.text.set_visible(True)
+    def drag_stats(self):
+        """점을 누른 뒤 첫 움직임까지의 지연 시간 요약"""
+        return self.drag_latency.summary()
 
-    def on_motion(self, event):
-        if not self.is_dragging or self.selected_point is None or event.inaxes != self.matrix.ax:
-            return
+    def on_pie_click(self, event):
+        """파이 차트 클릭: 타이머 버튼 처리 후 파이 영역만 다시 그림"""
+        self.pie_chart.on_button_click(event)
+        self.renderer.render('pie')
 
-        if event.xdata is None or event.ydata is None:
+    def on_press(self, event):
+        if event.inaxes != self.matrix.ax:
             return
+        self.press(event.xdata, event.ydata)
 
-        # 범위 제한 (0.5 ~ 5.5)
-        x_val = min(max(event.xdata, 0.5), 5.5)
-        y_val = min(max(event.ydata, 0.5), 5.5)
-
-        # 점 위치 업데이트
-        self.selected_point.update_position(x_val, y_val)
-
-        # 배경 복원
-        self.fig.canvas.restore_region(self.background)
-
-        # 점 위치 업데이트
-        self.selected_point.scatter.set_offsets([[x_val, y_val]])
-        if self.selected_point.text is not None:
-            self.selected_point.text.set_position((x_val, y_val + 0.2))
-
-        # 변경된 점만 다시 그리기
-        self.matrix.ax.draw_artist(self.selected_point.scatter)
-        if self.selected_point.text is not None:
-            self.matrix.ax.draw_artist(self.selected_point.text)
-
-        # 변경된 영역만 업데이트
-        self.fig.canvas.blit(self.matrix.ax.bbox)
+    def on_motion(self, event):
+        if event.inaxes != self.matrix.ax or event.xdata is None or event.ydata is None:
+            return
+        self.drag_to(event.xdata, event.ydata)
 
     def on_release(self, event):
-        if self.selected_point is not None:
-            # 가장 가까운 그리드 좌표 계산
-            x_val = round(self.selected_point.task.urgency)
-            y_val = round(self.selected_point.task.importance)
-
-            # 범위 제한 (1 ~ 5)
-            x_val = min(max(x_val, 1), 5)
-            y_val = min(max(y_val, 1), 5)
-
-            # 긴급도가 0이면 작업 제거
-            if x_val == 0:
-                task_name = self.selected_point.task.name
-                self.task_manager.remove_task(task_name)
-            else:
-                # 점 위치 업데이트
-                self.selected_point.update_position(x_val, y_val)
-                self.task_manager.update_task_position(
-                    self.selected_point.task.name,
-                    x_val,
-                    y_val
-                )
-
-            self._update_plots(self.task_manager.available_minutes)
-
-            # 배경 업데이트
-            self.fig.canvas.draw()
-            self.background = self.fig.canvas.copy_from_bbox(
-                self.matrix.ax.bbox)
-
-            self.selected_point = None
-            self.is_dragging = False
-
-    def reset(self, event):
-        # 리셋 버튼 클릭 시 호출
-        self.task_manager.tasks = []
-        self.task_manager._save_tasks()
-        self._update_plots(self.task_manager.available_hours *
-                           60 + self.task_manager.available_minutes_part)
+        self.release()
 
     def increase_font_size(self, event):
         # 폰트 크기 배수 증가
         self.font_mult = min(2.0, self.font_mult + 0.1)
-        plt.rcParams['font.size'] = self.base_font_size * self.font_mult
 
         # 모든 텍스트 요소 업데이트
         self.update_all_text_sizes()
-        self.fig.canvas.draw_idle()
+        self.renderer.invalidate()
 
     def decrease_font_size(self, event):
         # 폰트 크기 배수 감소
         self.font_mult = max(0.1, self.font_mult - 0.1)
-        plt.rcParams['font.size'] = self.base_font_size * self.font_mult
 
         # 모든 텍스트 요소 업데이트
         self.update_all_text_sizes()
-        self.fig.canvas.draw_idle()
+        self.renderer.invalidate()
 
     def update_all_text_sizes(self):
+        # 이후에 새로 만드는 텍스트도 같은 크기를 쓰도록 구성 요소에 전달
+        self.pie_chart.font_mult = self.font_mult
+        self.matrix.update_font_size(self.font_mult)
+
         # 파이 차트 텍스트 업데이트
         for text in self.pie_chart.ax.texts:
             text.set_fontsize(self.base_font_size * self.font_mult)
@@ -345,21 +264,7 @@ class EisenhowerVisualizer:
             labelsize=self.base_font_size * self.font_mult
         )
 
-    def add_task(self, event):
-        # 할 일 입력 다이얼로그 표시
-        dialog = TaskInputDialog()
-        if dialog.exec_() == QDialog.Accepted:
-            task_name = dialog.input_field.text().strip()
-            if task_name:
-                # 랜덤 위치 생성 (1-5 사이)
-                urgency = random.randint(1, 5)
-                importance = random.randint(1, 5)
-
-                # 새로운 작업 추가
-                self.task_manager.add_task(task_name, urgency, importance)
-                self._update_plots(self.task_manager.available_minutes)
-
     def show(self):
-        # 플롯 표시
-        self.setup_initial_plot()
-        plt.show()
+        # Qt 창에 그림을 붙여 표시 (Qt 이벤트 루프에서 실행)
+        from .main_window import run_window
+        run_window(self)
@@ -1,15 +1,38 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from eisenhower.task_manager import TaskManager
-from eisenhower.visualizer import EisenhowerVisualizer
+import sys
+import argparse
 
 
 def main():
+    parser = argparse.ArgumentParser(description="아이젠하워 매트릭스")
+    parser.add_argument('--backend', choices=['matplotlib', 'scene'], default='matplotlib',
+                        help="렌더링 백엔드 (scene: QGraphicsScene)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="첫 화면까지의 시간을 재고 예산을 넘으면 실패로 종료")
+    parser.add_argument('--budget', type=float, default=None,
+                        help="--profile-startup의 첫 화면까지 예산 (초)")
+    args = parser.parse_args()
+
+    # 무거운 모듈은 필요한 것만 여기서 불러옴
+    if args.profile_startup:
+        from eisenhower.startup import STARTUP_BUDGET, profile_startup
+        budget = args.budget if args.budget is not None else STARTUP_BUDGET
+        sys.exit(profile_startup(args.backend, budget))
+
+    from eisenhower.task_manager import TaskManager
+
     # TaskManager 인스턴스 생성
     task_manager = TaskManager()
 
+    if args.backend == 'scene':
+        from eisenhower.scene_window import run_scene_window
+        run_scene_window(task_manager)
+        return
+
     # EisenhowerVisualizer 인스턴스 생성
+    from eisenhower.visualizer import EisenhowerVisualizer
     visualizer = EisenhowerVisualizer(task_manager)
 
     # 시각화 실행